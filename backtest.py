@@ -14,7 +14,7 @@ from __future__ import annotations
 
 import os
 import sys
-import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 
@@ -28,7 +28,7 @@ from config import settings
 from core.canslim.a_annual_earnings import evaluate_a
 from core.canslim.c_current_earnings import evaluate_c
 from core.canslim.i_institutional import evaluate_i
-from core.canslim.m_market_direction import evaluate_m
+from core.canslim.m_market_direction import score_market_trend
 from core.canslim.s_supply_demand import evaluate_s
 from core.data_client import (
     clear_session_cache,
@@ -36,10 +36,10 @@ from core.data_client import (
     extract_float_series,
     fetch_bulk_close_prices,
     fetch_fundamental_data_as_of,
-    fetch_ohlcv,
+    fetch_ohlcv_bulk,
+    prefetch_fundamental_histories,
 )
 from core.index_ticker_fetcher import get_sp500_tickers
-from core.momentum_analysis import calculate_weighted_performance
 
 # ---------------------------------------------------------------------------
 # Configuration
@@ -50,19 +50,16 @@ LOOKBACK_YEARS = 2
 
 
 def _download_price_data(tickers: List[str], period: str = "3y") -> Dict[str, pd.DataFrame]:
-    """Download OHLCV data for each ticker individually via Alpaca."""
-    data = {}
+    """Download OHLCV data for all tickers in a single Alpaca request."""
+    print(f"  Downloading {', '.join(tickers)}...")
+    try:
+        data = fetch_ohlcv_bulk(tickers, period=period)
+    except Exception as e:
+        print(f"    ERROR downloading price data: {e}")
+        return {}
     for ticker in tickers:
-        print(f"  Downloading {ticker}...")
-        try:
-            df = fetch_ohlcv(ticker, period=period)
-            if not df.empty and "Close" in df.columns:
-                data[ticker] = df
-            else:
-                print(f"    WARNING: No data for {ticker}")
-        except Exception as e:
-            print(f"    ERROR downloading {ticker}: {e}")
-        time.sleep(0.3)
+        if ticker not in data or "Close" not in data[ticker].columns:
+            print(f"    WARNING: No data for {ticker}")
     return data
 
 
@@ -79,58 +76,144 @@ def _download_bulk_closes(tickers: List[str], period: str = "3y") -> pd.DataFram
     return fetch_bulk_close_prices(tickers, period=period, chunk_size=settings.CHUNK_SIZE)
 
 
-def _calculate_rs_at_date(all_closes: pd.DataFrame, ticker: str, eval_date: pd.Timestamp) -> float:
-    """Calculate RS score for a ticker as-of a specific date."""
-    # Slice data up to eval_date
-    sliced = all_closes.loc[:eval_date].dropna(axis=1, how="all")
-    if ticker not in sliced.columns:
-        return 0.0
+def _precompute_rs_inputs(all_closes: pd.DataFrame) -> Dict[str, object]:
+    """Pack the RS universe closes into arrays that can be ranked per eval date.
+
+    Each column's non-NaN closes are shifted to the top of ``values`` (in
+    date order), so ``values[k, j]`` is the k-th available close of ticker
+    ``j``. ``counts[i, j]`` is how many closes ticker ``j`` has on or before
+    row ``i``; together they reproduce ``all_closes.loc[:date][col].dropna()``
+    for any date without slicing the frame.
+    """
+    closes = all_closes.to_numpy(dtype=np.float64)
+    missing = np.isnan(closes)
+    order = np.argsort(missing, axis=0, kind="stable")
+    return {
+        "columns": all_closes.columns,
+        "values": np.take_along_axis(closes, order, axis=0),
+        "counts": np.cumsum(~missing, axis=0),
+    }
+
+
+def _rs_score_table(rs_inputs: Dict[str, object], rows: np.ndarray, tickers: List[str]) -> np.ndarray:
+    """Calculate RS scores for ``tickers`` at many as-of dates in one pass.
 
-    # Calculate weighted performance for all tickers
-    perfs = {}
-    for col in sliced.columns:
-        series = sliced[col].dropna()
-        if len(series) < 60:
-            continue  # Ignore stocks with less than ~3 months of history
+    Matches ``calculate_weighted_performance`` per ticker (with the raw
+    return fallback for IPOs/spinoffs), but builds the performance of every
+    universe column at every date as one matrix and ranks all dates with a
+    single ``DataFrame.rank(axis=1)`` call.
 
-        wp = calculate_weighted_performance(series)
+    Args:
+        rs_inputs: Output of ``_precompute_rs_inputs``.
+        rows: Number of closes-matrix rows on or before each eval date.
+        tickers: Tickers to return scores for.
 
+    Returns:
+        Array of shape ``(len(rows), len(tickers))``. A ticker scores 0.0 on
+        dates where it is not ranked: not in the universe, under ~3 months
+        of history, or fewer than 10 tickers qualify.
+    """
+    values = rs_inputs["values"]
+    rows = np.asarray(rows)
+    table = np.zeros((len(rows), len(tickers)))
+    if values.shape[0] == 0:
+        return table
+
+    n = rs_inputs["counts"][np.maximum(rows - 1, 0)]
+    n[rows == 0] = 0
+    # Ignore stocks with less than ~3 months of history
+    eligible = n >= 60
+    eligible &= (np.count_nonzero(eligible, axis=1) >= 10)[:, None]
+    cols = np.arange(values.shape[1])
+
+    def _close(offset: int) -> np.ndarray:
+        # offset-th close from the end of each ticker's as-of history (1 = latest)
+        return values[np.maximum(n - offset, 0), cols]
+
+    days_per_q = settings.TRADING_DAYS_PER_QUARTER
+    with np.errstate(divide="ignore", invalid="ignore"):
+        latest = _close(1)
+        q1_start = _close(days_per_q)
+        q2_start = _close(2 * days_per_q)
+        q3_start = _close(3 * days_per_q)
+        q4_start = _close(4 * days_per_q)
+        weighted = (
+            (settings.RS_Q1_WEIGHT * (latest / q1_start - 1))
+            + (settings.RS_Q2_WEIGHT * (q1_start / q2_start - 1))
+            + (settings.RS_Q3_WEIGHT * (q2_start / q3_start - 1))
+            + (settings.RS_Q4_WEIGHT * (q3_start / q4_start - 1))
+        )
         # FALLBACK FOR IPOs/SPINOFFS (like GEV):
         # If the stock doesn't have enough history for the standard 1-year
         # weighted performance, calculate its raw return over its available life.
-        if wp is None and len(series) >= 60:
-            wp = (series.iloc[-1] - series.iloc[0]) / series.iloc[0]
+        first = values[0]
+        raw_return = (latest - first) / first
+    perf = np.where(n >= 4 * days_per_q, weighted, raw_return)
+
+    # Rank every date at once; ineligible tickers are NaN so they are left out
+    # of each date's percentile denominator.
+    ranks = pd.DataFrame(np.where(eligible, perf, np.nan)).rank(axis=1, pct=True).to_numpy()
+    scores = np.where(eligible, ranks * settings.RS_PERCENTILE_MULTIPLIER + settings.RS_PERCENTILE_MIN, 0.0)
+
+    positions = rs_inputs["columns"].get_indexer(tickers)
+    found = positions >= 0
+    table[:, found] = scores[:, positions[found]]
+    return table
 
-        if wp is not None:
-            perfs[col] = wp
 
-    if ticker not in perfs or len(perfs) < 10:
-        return 0.0
+def _precompute_market_series(spy_data: pd.DataFrame) -> Dict[str, np.ndarray]:
+    """Compute SPY close/volume and the 21/50/200 EMAs once over the full history.
+
+    EMAs are causal, so the value at row ``i`` only depends on rows ``<= i``.
+    Slicing these series per eval date yields exactly what recomputing
+    ``ewm`` on ``spy_data.loc[:eval_date]`` would, without the O(N·K) cost.
+    They are kept as plain arrays so the per-date prefix slices are views.
+    """
+    closes = extract_float_series(spy_data, "Close")
+    return {
+        "closes": closes.to_numpy(),
+        "volumes": extract_float_series(spy_data, "Volume").to_numpy(),
+        "ema_21": closes.ewm(span=21).mean().to_numpy(),
+        "ema_50": closes.ewm(span=50).mean().to_numpy(),
+        "ema_200": closes.ewm(span=200).mean().to_numpy(),
+    }
 
-    # Rank
-    perf_series = pd.Series(perfs)
-    ranks = perf_series.rank(pct=True)
-    rs_score = ranks[ticker] * settings.RS_PERCENTILE_MULTIPLIER + settings.RS_PERCENTILE_MIN
-    return float(rs_score)
 
+def _evaluate_market_at_date(spy_series: Dict[str, np.ndarray], as_of: int) -> Tuple[float, bool, int, bool]:
+    """Evaluate M (Market Direction) as-of a specific date using precomputed SPY series.
 
-def _evaluate_market_at_date(spy_data: pd.DataFrame, eval_date: pd.Timestamp) -> Tuple[float, bool, int, bool]:
-    """Evaluate M (Market Direction) as-of a specific date using SPY data.
+    Args:
+        spy_series: Output of ``_precompute_market_series``.
+        as_of: Number of SPY rows on or before the eval date.
 
     Returns: (score, is_bullish, distribution_days, follow_through)
     """
-    Sliced = spy_data.loc[:eval_date].copy()
-    trend = evaluate_m(price_data=Sliced)
+    trend = score_market_trend(
+        spy_series["closes"][:as_of],
+        spy_series["volumes"][:as_of],
+        ema_21=spy_series["ema_21"][:as_of],
+        ema_50=spy_series["ema_50"][:as_of],
+        ema_200=spy_series["ema_200"][:as_of],
+        benchmark_symbol=BENCHMARK,
+    )
     return trend.score, trend.is_bullish, trend.distribution_days, trend.follow_through
 
 
 def _evaluate_technical_at_date(
     ticker_data: pd.DataFrame,
-    eval_date: pd.Timestamp,
+    as_of: int,
     shares_outstanding: Optional[float],
+    rolling: Optional[Dict[str, np.ndarray]] = None,
 ) -> Dict[str, object]:
-    """Evaluate N and S technical criteria as-of a specific date."""
-    sliced = ticker_data.loc[:eval_date].copy()
+    """Evaluate N and S technical criteria as-of a specific date.
+
+    ``as_of`` is the number of rows of ``ticker_data`` on or before the eval
+    date (see ``_as_of_positions``). ``rolling`` holds the ticker's
+    precomputed 52-week high and 50-day mean volume per row (see
+    ``_precompute_rolling_technicals``); when given, the as-of values are
+    read from it instead of re-scanning the sliced windows.
+    """
+    sliced = ticker_data.iloc[:as_of]
     if len(sliced) < 60:
         return {
             "n_score": 0.0,
@@ -140,15 +223,18 @@ def _evaluate_technical_at_date(
             "has_volume_surge": False,
         }
 
-    closes = extract_float_series(sliced, "Close")
-    volumes = extract_float_series(sliced, "Volume")
+    closes = extract_float_series(sliced, "Close").to_numpy()
 
-    latest_close = coerce_scalar(closes.iloc[-1])
-    # 52-week high: use last 252 trading days or all available
-    lookback_252 = min(252, len(closes))
-    high_52 = coerce_scalar(closes.iloc[-lookback_252:].max())
+    latest_close = coerce_scalar(closes[-1])
+    if rolling is not None:
+        high_52 = coerce_scalar(rolling["high_252"][as_of - 1])
+        avg_vol_50 = float(rolling["avg_vol_50"][as_of - 1])
+    else:
+        # 52-week high: use last 252 trading days or all available
+        high_52 = coerce_scalar(np.nanmax(closes[-252:]))
+        volumes = extract_float_series(sliced, "Volume").to_numpy()
+        avg_vol_50 = float(np.nanmean(volumes[-50:]))
     proximity = latest_close / high_52 if high_52 else 0.0
-    avg_vol_50 = float(volumes.tail(50).mean()) if len(volumes) >= 50 else float(volumes.mean())
 
     # N score (proximity only — we don't have historical quarterly revenue)
     if proximity >= 0.98:
@@ -160,7 +246,7 @@ def _evaluate_technical_at_date(
     else:
         proximity_score = 0.0
     # Use proximity as full N score since we can't get historical revenue
-    n_score = float(np.clip(proximity_score, 0, 1))
+    n_score = float(min(max(proximity_score, 0.0), 1.0))
 
     # S score
     score_s, s_metrics = evaluate_s(
@@ -181,11 +267,39 @@ def _evaluate_technical_at_date(
     }
 
 
-def _evaluate_fundamentals_at_date(symbol: str, eval_date: pd.Timestamp) -> Dict[str, object]:
+def _as_of_positions(index: pd.DatetimeIndex, eval_dates: np.ndarray) -> np.ndarray:
+    """Number of rows of ``index`` on or before each eval date (``.loc[:date]`` lengths)."""
+    return np.searchsorted(index.values, eval_dates, side="right")
+
+
+def _precompute_rolling_technicals(ticker_data: pd.DataFrame) -> Dict[str, np.ndarray]:
+    """Rolling 252-day high close and 50-day mean volume for every row.
+
+    Windows are shorter early in the history, matching the "last N days or
+    all available" rule used when slicing per eval date.
+    """
+    closes = extract_float_series(ticker_data, "Close")
+    volumes = extract_float_series(ticker_data, "Volume")
+    return {
+        "high_252": closes.rolling(252, min_periods=1).max().to_numpy(),
+        "avg_vol_50": volumes.rolling(50, min_periods=1).mean().to_numpy(),
+    }
+
+
+def _evaluate_fundamentals_at_date(
+    symbol: str,
+    eval_date: pd.Timestamp,
+    score_cache: Optional[Dict[tuple, Dict[str, object]]] = None,
+) -> Dict[str, object]:
     """Fetch and evaluate C, A, I fundamental scores as-of a specific date.
 
     Uses FMP's acceptedDate to filter only data that was publicly
     available by the evaluation date, eliminating look-ahead bias.
+
+    Filings only change a few times a year, so consecutive eval dates
+    usually see the same statements. When ``score_cache`` is given, scores
+    are memoized on the symbol plus the fiscal periods and company info
+    visible at this date, and only recomputed when a new filing appears.
     """
     try:
         fdata = fetch_fundamental_data_as_of(symbol, eval_date.to_pydatetime())
@@ -194,15 +308,27 @@ def _evaluate_fundamentals_at_date(symbol: str, eval_date: pd.Timestamp) -> Dict
         bs = fdata["balance_sheet"]
         info = fdata["company_info"]
 
-        score_c, current_growth = evaluate_c(qi)
-        score_a, annual_growth, roe = evaluate_a(ai, balance_sheet=bs)
-
         held_pct = info.get("held_percent_institutions")
         num_holders = info.get("institution_count")
-        score_i = evaluate_i(held_pct, num_institutional_holders=num_holders)
         shares = info.get("shares_outstanding")
 
-        return {
+        filing_key = (
+            symbol,
+            tuple(qi.columns),
+            tuple(ai.columns),
+            tuple(bs.columns),
+            held_pct,
+            num_holders,
+            shares,
+        )
+        if score_cache is not None and filing_key in score_cache:
+            return dict(score_cache[filing_key])
+
+        score_c, current_growth = evaluate_c(qi)
+        score_a, annual_growth, roe = evaluate_a(ai, balance_sheet=bs)
+        score_i = evaluate_i(held_pct, num_institutional_holders=num_holders)
+
+        scores = {
             "c_score": score_c,
             "a_score": score_a,
             "i_score": score_i,
@@ -211,6 +337,9 @@ def _evaluate_fundamentals_at_date(symbol: str, eval_date: pd.Timestamp) -> Dict
             "roe": roe,
             "shares_outstanding": shares,
         }
+        if score_cache is not None:
+            score_cache[filing_key] = scores
+        return dict(scores)
     except Exception as e:
         print(f"    ERROR fetching fundamentals for {symbol} @ {eval_date.date()}: {e}")
         return {
@@ -224,43 +353,40 @@ def _evaluate_fundamentals_at_date(symbol: str, eval_date: pd.Timestamp) -> Dict
         }
 
 
-def _compute_canslim_score(
-    c: float,
-    a: float,
-    n: float,
-    s: float,
-    l_score: float,
-    i: float,
-    m: float,
-    has_fundamentals: bool = True,
-) -> float:
-    """Compute weighted CANSLIM composite score (0-100)."""
-    if has_fundamentals:
-        score = (
-            settings.CANSLIM_WEIGHT_C * c
-            + settings.CANSLIM_WEIGHT_A * a
-            + settings.CANSLIM_WEIGHT_N * n
-            + settings.CANSLIM_WEIGHT_S * s
-            + settings.CANSLIM_WEIGHT_L * l_score
-            + settings.CANSLIM_WEIGHT_I * i
-            + settings.CANSLIM_WEIGHT_M * m
-        ) * 100
-    else:
-        tw = (
-            settings.CANSLIM_WEIGHT_N
-            + settings.CANSLIM_WEIGHT_S
-            + settings.CANSLIM_WEIGHT_L
-            + settings.CANSLIM_WEIGHT_I
-            + settings.CANSLIM_WEIGHT_M
-        )
-        score = (
-            (settings.CANSLIM_WEIGHT_N / tw) * n
-            + (settings.CANSLIM_WEIGHT_S / tw) * s
-            + (settings.CANSLIM_WEIGHT_L / tw) * l_score
-            + (settings.CANSLIM_WEIGHT_I / tw) * i
-            + (settings.CANSLIM_WEIGHT_M / tw) * m
-        ) * 100
-    return float(score)
+def _compute_canslim_scores(components: np.ndarray, has_fundamentals: np.ndarray) -> np.ndarray:
+    """Compute weighted CANSLIM composite scores (0-100) for many rows at once.
+
+    Args:
+        components: ``(rows, 7)`` array of C, A, N, S, L, I, M scores (0-1).
+        has_fundamentals: Boolean per row; rows without fundamentals drop the
+            C and A weights and renormalize the remaining five to sum to 1.
+
+    Returns:
+        Composite score per row.
+    """
+    weights = np.array(
+        [
+            settings.CANSLIM_WEIGHT_C,
+            settings.CANSLIM_WEIGHT_A,
+            settings.CANSLIM_WEIGHT_N,
+            settings.CANSLIM_WEIGHT_S,
+            settings.CANSLIM_WEIGHT_L,
+            settings.CANSLIM_WEIGHT_I,
+            settings.CANSLIM_WEIGHT_M,
+        ]
+    )
+    technical_weights = weights.copy()
+    technical_weights[:2] = 0.0
+    technical_weights /= technical_weights.sum()
+
+    row_weights = np.where(np.asarray(has_fundamentals, dtype=bool)[:, None], weights, technical_weights)
+    return (components * row_weights).sum(axis=1) * 100
+
+
+def _round_column(values: np.ndarray, ndigits: int) -> np.ndarray:
+    """Round each value with Python's ``round`` (exact decimal ties), keeping float64."""
+    flat = values.ravel()
+    return np.fromiter((round(v, ndigits) for v in flat.tolist()), dtype=float, count=flat.size).reshape(values.shape)
 
 
 # ---------------------------------------------------------------------------
@@ -292,12 +418,18 @@ def run_backtest() -> pd.DataFrame:
     print("\n[2/3] Downloading S&P 500 universe for RS ranking...")
     print("  NOTE: Using current S&P 500 members introduces survivorship bias in historical RS ranking.")
     sp500_tickers = get_sp500_tickers()
-    all_rs_tickers = list(set(BACKTEST_TICKERS + sp500_tickers))
-    all_closes = _download_bulk_closes(all_rs_tickers, period="3y")
+    # Backtest tickers already have closes in their step-1 OHLCV frames, so only
+    # the rest of the universe is requested; both steps then share one close series.
+    ohlcv_closes = pd.DataFrame({t: ticker_ohlcv[t]["Close"] for t in BACKTEST_TICKERS if t in ticker_ohlcv})
+    all_rs_tickers = list(set(BACKTEST_TICKERS + sp500_tickers) - set(ohlcv_closes.columns))
+    all_closes = _download_bulk_closes(all_rs_tickers, period="3y").join(ohlcv_closes, how="outer")
     print(f"  Got close data for {len(all_closes.columns)} tickers")
 
     # --- Step 3: Run backtest (fundamentals fetched per-date for point-in-time) ---
     print("\n[3/3] Running backtest evaluations...")
+    # Full filing histories are fetched once per ticker up front (in parallel);
+    # the per-date point-in-time filtering below then runs from cache.
+    prefetch_fundamental_histories([t for t in BACKTEST_TICKERS if t in ticker_ohlcv])
 
     end_date = datetime.now()
     start_date = end_date - timedelta(days=LOOKBACK_YEARS * 365)
@@ -309,34 +441,69 @@ def run_backtest() -> pd.DataFrame:
 
     print(f"  {len(eval_dates)} trading days from {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}")
 
-    records = []
+    # Indicators that only depend on each series' own history are computed
+    # once here and indexed per eval date below.
+    spy_series = _precompute_market_series(spy_data)
+    rolling = {t: _precompute_rolling_technicals(df) for t, df in ticker_ohlcv.items() if t in BACKTEST_TICKERS}
+    rs_inputs = _precompute_rs_inputs(all_closes)
+    fundamental_scores: Dict[tuple, Dict[str, object]] = {}
+
+    # Row counts on or before every eval date, so the loop slices by position
+    # instead of label-slicing each DatetimeIndex per (date, ticker).
+    eval_dates_ns = valid_trading_days.values
+    spy_as_of = _as_of_positions(spy_data.index, eval_dates_ns)
+    ticker_as_of = {t: _as_of_positions(df.index, eval_dates_ns) for t, df in ticker_ohlcv.items()}
+    rs_table = _rs_score_table(rs_inputs, _as_of_positions(all_closes.index, eval_dates_ns), BACKTEST_TICKERS)
+
+    # Output columns are filled into preallocated typed arrays with one fixed
+    # slot per (date, ticker), so eval dates can be scored concurrently without
+    # any merge step; slots that were skipped are dropped after the loop.
+    n_tickers = len(BACKTEST_TICKERS)
+    n_rows = len(eval_dates) * n_tickers
+    row_dates = np.repeat(valid_trading_days.values.astype("datetime64[ns]"), n_tickers)
+    row_tickers = np.tile(np.array(BACKTEST_TICKERS, dtype=object), len(eval_dates))
+    written = np.zeros(n_rows, dtype=bool)
+    close_prices = np.empty(n_rows)
+    rs_values = np.empty(n_rows)
+    proximities = np.empty(n_rows)
+    components = np.empty((n_rows, 7))  # C, A, N, S, L, I, M
+    has_fundamentals_flags = np.zeros(n_rows, dtype=bool)
+    mkt_bullish_flags = np.zeros(n_rows, dtype=bool)
+    dist_day_counts = np.zeros(n_rows, dtype=np.int64)
+    ftd_flags = np.zeros(n_rows, dtype=bool)
+    breakout_flags = np.zeros(n_rows, dtype=bool)
+    surge_flags = np.zeros(n_rows, dtype=bool)
+    peg_flags = np.zeros(n_rows, dtype=bool)
+    signal_ready = np.zeros(n_rows, dtype=bool)
+
+    def _evaluate_date(date_pos: int) -> None:
+        """Score every backtest ticker at one eval date into its own output slots."""
+        eval_date = eval_dates[date_pos]
 
-    for eval_date in eval_dates:
         # Market direction at this date
-        spy_data = ticker_ohlcv[BENCHMARK]
-        m_score, m_bullish, dist_days, ftd = _evaluate_market_at_date(spy_data, eval_date)
+        m_score, m_bullish, dist_days, ftd = _evaluate_market_at_date(spy_series, int(spy_as_of[date_pos]))
 
-        for ticker in BACKTEST_TICKERS:
+        for ticker_pos, ticker in enumerate(BACKTEST_TICKERS):
             if ticker not in ticker_ohlcv:
                 continue
 
             tdata = ticker_ohlcv[ticker]
             # Check if we have data at this date
-            available = tdata.loc[:eval_date]
-            if len(available) < 60:
+            as_of = int(ticker_as_of[ticker][date_pos])
+            if as_of < 60:
                 continue
 
             # RS score
-            rs_score = _calculate_rs_at_date(all_closes, ticker, eval_date)
+            rs_score = float(rs_table[date_pos, ticker_pos])
 
             # L score (RS / 100)
             l_score = rs_score / 100.0
 
             # Fundamental scores (point-in-time via FMP)
-            fund = _evaluate_fundamentals_at_date(ticker, eval_date)
+            fund = _evaluate_fundamentals_at_date(ticker, eval_date, fundamental_scores)
 
             # Technical scores (N, S)
-            tech = _evaluate_technical_at_date(tdata, eval_date, fund.get("shares_outstanding"))
+            tech = _evaluate_technical_at_date(tdata, as_of, fund.get("shares_outstanding"), rolling[ticker])
 
             # Fundamental scores
             c_score = fund.get("c_score", 0.0)
@@ -344,18 +511,6 @@ def run_backtest() -> pd.DataFrame:
             i_score = fund.get("i_score", 0.5)
             has_fundamentals = fund.get("current_growth") is not None or fund.get("annual_growth") is not None
 
-            # Composite CANSLIM score
-            total = _compute_canslim_score(
-                c=c_score,
-                a=a_score,
-                n=tech["n_score"],
-                s=tech["s_score"],
-                l_score=l_score,
-                i=i_score,
-                m=m_score,
-                has_fundamentals=has_fundamentals,
-            )
-
             # --- UPDATED SIGNAL LOGIC ---
             has_breakout = bool(tech.get("is_breakout", False))
             has_surge = bool(tech.get("has_volume_surge", False))
@@ -364,48 +519,79 @@ def run_backtest() -> pd.DataFrame:
             peg_details = tech.get("power_gap_details") or {}
             has_peg_today = bool(tech.get("has_power_gap", False)) and peg_details.get("days_ago") == 0
 
-            # A valid buy requires a bullish market AND (either a volume breakout OR a power earnings gap)
-            # buy_signal = (
-            #     total >= settings.MIN_CANSLIM_SCORE
-            #     and rs_score >= settings.MIN_RS_SCORE
-            #     and bool(m_bullish)
-            #     and ((has_breakout and has_surge) or has_peg_today)
-            # )
-            # Testing technicals only and disregarding bear market condition:
-            buy_signal = (
-                total >= 40  # Lowered to account for missing free-tier API fundamentals
-                and rs_score >= settings.MIN_RS_SCORE
-                # and bool(m_bullish)  <-- COMMENT THIS OUT to allow buys in bad markets
-                and ((has_breakout and has_surge) or has_peg_today)
-            )
-            close_price = tech["close"]
-
-            records.append(
-                {
-                    "Date": eval_date.strftime("%Y-%m-%d"),
-                    "Ticker": ticker,
-                    "Close": round(close_price, 2),
-                    "RS_Score": round(rs_score, 1),
-                    "CANSLIM_Score": round(total, 1),
-                    "C": round(c_score * 100, 0),
-                    "A": round(a_score * 100, 0),
-                    "N": round(tech["n_score"] * 100, 0),
-                    "S": round(tech["s_score"] * 100, 0),
-                    "L": round(l_score * 100, 0),
-                    "I": round(i_score * 100, 0),
-                    "M": round(m_score * 100, 0),
-                    "52w_Prox": round(tech["proximity"] * 100, 1),
-                    "Mkt_Bullish": m_bullish,
-                    "Dist_Days": dist_days,
-                    "FTD": ftd,
-                    "Is_Breakout": tech.get("is_breakout", False),
-                    "Has_Vol_Surge": tech.get("has_volume_surge", False),
-                    "Has_PEG": has_peg_today,
-                    "BUY_SIGNAL": buy_signal,
-                }
-            )
+            row = date_pos * n_tickers + ticker_pos
+            written[row] = True
+            close_prices[row] = tech["close"]
+            rs_values[row] = rs_score
+            proximities[row] = tech["proximity"]
+            # Composite CANSLIM score is computed for all rows after the loop
+            components[row] = (c_score, a_score, tech["n_score"], tech["s_score"], l_score, i_score, m_score)
+            has_fundamentals_flags[row] = has_fundamentals
+            mkt_bullish_flags[row] = m_bullish
+            dist_day_counts[row] = dist_days
+            ftd_flags[row] = ftd
+            breakout_flags[row] = has_breakout
+            surge_flags[row] = has_surge
+            peg_flags[row] = has_peg_today
+            # Everything except the composite-score threshold (applied after the loop)
+            signal_ready[row] = rs_score >= settings.MIN_RS_SCORE and ((has_breakout and has_surge) or has_peg_today)
+
+    # Eval dates are independent once the inputs above are precomputed, and
+    # each writes only its own slots. The shared fundamentals memo may compute
+    # the same key twice under a race, which is harmless.
+    with ThreadPoolExecutor(max_workers=settings.MAX_WORKERS) as executor:
+        list(executor.map(_evaluate_date, range(len(eval_dates))))
+
+    if not written.any():
+        return pd.DataFrame()
 
-    df = pd.DataFrame(records)
+    row_dates = row_dates[written]
+    row_tickers = row_tickers[written]
+    close_prices = close_prices[written]
+    rs_values = rs_values[written]
+    proximities = proximities[written]
+    components = components[written]
+    totals = _compute_canslim_scores(components, has_fundamentals_flags[written])
+    component_pcts = _round_column(components * 100, 0)
+
+    # A valid buy requires a bullish market AND (either a volume breakout OR a power earnings gap)
+    # buy_signal = (
+    #     total >= settings.MIN_CANSLIM_SCORE
+    #     and rs_score >= settings.MIN_RS_SCORE
+    #     and bool(m_bullish)
+    #     and ((has_breakout and has_surge) or has_peg_today)
+    # )
+    # Testing technicals only and disregarding bear market condition:
+    buy_signals = (
+        (totals >= 40)  # Lowered to account for missing free-tier API fundamentals
+        & signal_ready[written]
+        # & mkt_bullish_flags[written]  <-- COMMENT THIS OUT to allow buys in bad markets
+    )
+
+    df = pd.DataFrame(
+        {
+            "Date": pd.DatetimeIndex(row_dates).strftime("%Y-%m-%d"),
+            "Ticker": row_tickers,
+            "Close": _round_column(close_prices, 2),
+            "RS_Score": _round_column(rs_values, 1),
+            "CANSLIM_Score": _round_column(totals, 1),
+            "C": component_pcts[:, 0],
+            "A": component_pcts[:, 1],
+            "N": component_pcts[:, 2],
+            "S": component_pcts[:, 3],
+            "L": component_pcts[:, 4],
+            "I": component_pcts[:, 5],
+            "M": component_pcts[:, 6],
+            "52w_Prox": _round_column(proximities * 100, 1),
+            "Mkt_Bullish": mkt_bullish_flags[written],
+            "Dist_Days": dist_day_counts[written],
+            "FTD": ftd_flags[written],
+            "Is_Breakout": breakout_flags[written],
+            "Has_Vol_Surge": surge_flags[written],
+            "Has_PEG": peg_flags[written],
+            "BUY_SIGNAL": buy_signals,
+        }
+    )
     return df
 
 
@@ -35,6 +35,7 @@ MIN_CANSLIM_SCORE = 65  # Free-tier friendly default; raise toward 70-75 with fu
 # the list with genuinely weak names.
 WATCHLIST_MIN_CANSLIM_SCORE = 30  # Lowered from 45 — bear-market watchlist must still populate
 REQUIRE_BULLISH_MARKET_FOR_BUYS = True  # O'Neil-style market gate for actionable entries
+SKIP_SCAN_IN_BEARISH_MARKET = False  # Skip all per-symbol fetches when M is not bullish (no watchlist is built)
 MAX_TERMINAL_RESULTS = 12  # Limit terminal detail; full output is exported to CSV
 AUTO_EXPORT_RESULTS = True  # Save scanner output to CSV by default
 RESULTS_DIR = "scan_results"  # Directory for exported scanner CSV files
@@ -70,6 +71,7 @@ RS_CACHE_DIR = "rs_score_cache"  # Directory for RS score cache
 RS_CACHE_FILE = "rs_scores_cache.csv"  # Cache filename
 TICKER_CACHE_DIR = "ticker_cache"  # Directory for index ticker cache
 TICKER_CACHE_EXPIRY_HOURS = 24  # How often to refresh ticker lists
+SCORE_CACHE_DIR = "score_cache"  # Directory for per-session evaluate_canslim() results
 
 
 # ==============================================================================
@@ -225,3 +227,7 @@ HTTP_RETRY_TOTAL = 5  # Maximum retry attempts
 HTTP_RETRY_BACKOFF = 2  # Exponential backoff factor
 HTTP_RETRY_STATUS_CODES = [429, 500, 502, 503, 504]  # Retry on these codes
 HTTP_MAX_WORKERS = 5  # Parallel API requests
+
+# FMP's stable free tier has no institutional-holder endpoint; every request is
+# a wasted round-trip. Enable on a plan that includes it.
+FMP_INSTITUTIONAL_HOLDERS_ENABLED = False
@@ -0,0 +1,54 @@
+"""Growth helpers shared by the C, A and N evaluators."""
+
+from __future__ import annotations
+
+import math
+from typing import List, Optional
+
+import numpy as np
+
+# Same cutoff as np.isclose(x, 0.0) with its default atol, without the array round-trip
+_ZERO_TOLERANCE = 1e-8
+
+
+def safe_growth(current: float, previous: float) -> Optional[float]:
+    """Calculate period-over-period growth as a decimal.
+
+    Returns None when either value is missing or when previous is zero or
+    negative — transitioning from a loss to a profit produces misleading
+    growth percentages, and CANSLIM requires established, positive earnings.
+    """
+    if current is None or previous in (None, 0):
+        return None
+
+    try:
+        current = float(current)
+        previous = float(previous)
+    except (TypeError, ValueError):
+        return None
+
+    if math.isnan(current) or math.isnan(previous) or previous <= _ZERO_TOLERANCE:
+        return None
+
+    return (current - previous) / abs(previous)
+
+
+def score_from_growth(growth: float, target: float) -> float:
+    """Convert a growth rate into a 0-1 score: linear up to twice ``target``, 0.5 at target."""
+    return min(max(growth / target, 0.0), 2.0) / 2
+
+
+def safe_growth_vec(current: np.ndarray, previous: np.ndarray) -> np.ndarray:
+    """Element-wise ``safe_growth``: growth as a decimal, NaN where undefined.
+
+    Growth is undefined when either value is missing or the previous value is
+    zero or negative (CANSLIM requires established, positive earnings).
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        growth = (current - previous) / np.abs(previous)
+    return np.where(previous <= _ZERO_TOLERANCE, np.nan, growth)
+
+
+def growths_to_list(growths: np.ndarray) -> List[Optional[float]]:
+    """Convert a growth array to the list form the scorers use (None where undefined)."""
+    return [None if np.isnan(g) else float(g) for g in growths]
@@ -0,0 +1,109 @@
+"""Row lookup helpers shared by the financial-statement evaluators."""
+
+from __future__ import annotations
+
+import re
+from itertools import chain
+from typing import Optional, Sequence
+
+import pandas as pd
+
+# Earnings rows shared by C and A, so both resolve a statement the same way
+EPS_LABELS = ("Diluted EPS", "Basic EPS")
+EPS_PATTERN = re.compile(r"Basic EPS|Diluted EPS", re.IGNORECASE)
+NET_INCOME_LABELS = ("Net Income", "Net Income Common Stockholders", "Net Income From Continuing Operations")
+NET_INCOME_PATTERN = re.compile(r"Net Income", re.IGNORECASE)
+
+
+def find_row_label(index: pd.Index, labels: Sequence[str], pattern: re.Pattern) -> Optional[str]:
+    """Find a statement row label, trying exact canonical labels first.
+
+    The FMP-backed frames always use the canonical labels, so the common case
+    is a hash lookup; otherwise the first label (in index order) matching
+    ``pattern`` is returned, like a ``str.contains`` scan would.
+
+    Args:
+        index: Row labels of a financial-statement DataFrame.
+        labels: Canonical labels in priority order.
+        pattern: Compiled fallback pattern, matched with ``search``.
+
+    Returns:
+        The matching label, or None if nothing matches.
+    """
+    for label in labels:
+        if label in index:
+            return label
+    return next((label for label in index if isinstance(label, str) and pattern.search(label)), None)
+
+
+def statement_row(df: pd.DataFrame, label: str) -> pd.Series:
+    """Return one statement row ordered oldest to newest.
+
+    FMP-backed frames already have their period columns sorted at ingestion,
+    and the index caches its monotonicity, so the common case skips the sort;
+    newest-first frames are reversed rather than sorted. A label that occurs
+    more than once resolves to its first row, as ``find_row_label`` would.
+    """
+    row = df.loc[label]
+    if isinstance(row, pd.DataFrame):
+        row = row.iloc[0]
+    periods = row.index
+    if periods.is_monotonic_increasing:
+        return row
+    if periods.is_monotonic_decreasing and periods.is_unique:
+        return row.iloc[::-1]
+    return row.sort_index()
+
+
+def find_reported_row_label(df: pd.DataFrame, labels: Sequence[str], pattern: re.Pattern) -> Optional[str]:
+    """Like ``find_row_label``, but skip rows whose newest period is missing.
+
+    FMP leaves a field NaN when a filing doesn't report it (e.g. no
+    ``epsDiluted``), so a higher-priority row can exist yet be empty for the
+    latest period; the next candidate that reports it is used instead.
+
+    Args:
+        df: Financial-statement DataFrame (rows = labels, columns = periods).
+        labels: Canonical labels in priority order.
+        pattern: Compiled fallback pattern, matched with ``search``.
+
+    Returns:
+        The first matching label with a newest value, or None.
+    """
+    canonical = [label for label in labels if label in df.index]
+    fallback = (
+        label for label in df.index if isinstance(label, str) and label not in canonical and pattern.search(label)
+    )
+    for label in chain(canonical, fallback):
+        row = statement_row(df, label)
+        if len(row) and pd.notna(row.iloc[-1]):
+            return label
+    return None
+
+
+def find_earnings_row(df: pd.DataFrame) -> Optional[str]:
+    """Find the best earnings row label using fuzzy matching.
+
+    Priority:
+        1. Diluted EPS, then Basic EPS
+        2. Net Income (fallback)
+
+    A row whose newest period is missing is skipped in favour of the next one.
+
+    Args:
+        df: Income statement DataFrame with row labels as index.
+
+    Returns:
+        The matching index label, or None if nothing found.
+    """
+    # Priority 1: EPS rows, then Priority 2: Net Income — skipping rows the
+    # newest filing left empty (e.g. no diluted EPS reported)
+    row_label = find_reported_row_label(df, EPS_LABELS, EPS_PATTERN)
+    if row_label is None:
+        row_label = find_reported_row_label(df, NET_INCOME_LABELS, NET_INCOME_PATTERN)
+    if row_label is None:
+        # Nothing reported for the newest period; keep the best-labelled row
+        row_label = find_row_label(df.index, EPS_LABELS, EPS_PATTERN) or find_row_label(
+            df.index, NET_INCOME_LABELS, NET_INCOME_PATTERN
+        )
+    return row_label
@@ -12,85 +12,40 @@ Priority: EPS (Basic or Diluted) first, then fallback to Net Income.
 
 from __future__ import annotations
 
-from typing import List, Optional
+import re
+from typing import List, Optional, Sequence
 
+import numpy as np
 import pandas as pd
 
 from config import settings
 
+from ._growth import growths_to_list, safe_growth_vec, score_from_growth
+from ._labels import NET_INCOME_LABELS, NET_INCOME_PATTERN, find_earnings_row, find_row_label, statement_row
 
-def _safe_growth(current: float, previous: float) -> Optional[float]:
-    """Calculate YoY growth as a decimal.
+_EQUITY_LABELS = ("Total Stockholders Equity",)
+_EQUITY_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"Stockholders.? Equity",
+        r"Shareholders.? Equity",
+        r"Total Equity",
+        r"Common Stock Equity",
+    )
+)
 
-    Returns None when previous is negative to enforce the CANSLIM
-    requirement for established, positive earnings growth.
-    """
-    if current is None or previous in (None, 0):
-        return None
-
-    try:
-        current = float(current)
-        previous = float(previous)
-    except (TypeError, ValueError):
-        return None
-
-    import numpy as np
-
-    if np.isclose(previous, 0.0):
-        return None
-
-    # Reject negative prior-period earnings — transitioning from a loss
-    # to a profit produces misleading growth percentages for CANSLIM.
-    if previous < 0:
-        return None
-
-    try:
-        return (current - previous) / abs(previous)
-    except ZeroDivisionError:
-        return None
 
-
-def _find_earnings_row(df: pd.DataFrame) -> Optional[str]:
-    """Find the best earnings row label using fuzzy matching.
-
-    Priority:
-        1. Basic EPS or Diluted EPS
-        2. Net Income (fallback)
-
-    Args:
-        df: Income statement DataFrame with row labels as index.
-
-    Returns:
-        The matching index label, or None if nothing found.
-    """
-    # Priority 1: EPS rows
-    eps_mask = df.index.str.contains(r"Basic EPS|Diluted EPS", case=False, regex=True)
-    if eps_mask.any():
-        return df.index[eps_mask][0]
-
-    # Priority 2: Net Income
-    ni_mask = df.index.str.contains(r"Net Income", case=False, regex=True)
-    if ni_mask.any():
-        return df.index[ni_mask][0]
-
-    return None
-
-
-def _get_annual_growths(earnings: pd.Series) -> List[Optional[float]]:
+def _get_annual_growths(earnings: Sequence[float]) -> List[Optional[float]]:
     """Calculate year-over-year growth for each available year.
 
     Args:
-        earnings: Time-sorted annual earnings series (oldest to newest).
+        earnings: Time-sorted annual earnings values (oldest to newest).
 
     Returns:
         List of YoY growth rates (most recent first).
     """
-    growths = []
-    n = len(earnings)
-    for i in range(n - 1, 0, -1):
-        growth = _safe_growth(earnings.iloc[i], earnings.iloc[i - 1])
-        growths.append(growth)
-    return growths
+    values = np.asarray(earnings, dtype=np.float64)
+    return growths_to_list(safe_growth_vec(values[1:], values[:-1])[::-1])
 
 
 def _calculate_roe(annual_income: pd.DataFrame, balance_sheet: pd.DataFrame) -> Optional[float]:
@@ -107,29 +62,21 @@ def _calculate_roe(annual_income: pd.DataFrame, balance_sheet: pd.DataFrame) ->
     """
     try:
         # Find net income
-        ni_mask = annual_income.index.str.contains(r"Net Income", case=False, regex=True)
-        if not ni_mask.any():
+        ni_row = find_row_label(annual_income.index, NET_INCOME_LABELS, NET_INCOME_PATTERN)
+        if ni_row is None:
             return None
 
-        ni_row = annual_income.index[ni_mask][0]
-        net_income_series = annual_income.loc[ni_row].dropna().sort_index()
+        net_income_series = statement_row(annual_income, ni_row).dropna()
         if net_income_series.empty:
             return None
         net_income = float(net_income_series.iloc[-1])
 
-        # Find shareholders' equity
-        equity_patterns = [
-            r"Stockholders.? Equity",
-            r"Shareholders.? Equity",
-            r"Total Equity",
-            r"Common Stock Equity",
-        ]
+        # Find shareholders' equity (patterns in priority order)
         equity_val = None
-        for pattern in equity_patterns:
-            eq_mask = balance_sheet.index.str.contains(pattern, case=False, regex=True)
-            if eq_mask.any():
-                eq_row = balance_sheet.index[eq_mask][0]
-                eq_series = balance_sheet.loc[eq_row].dropna().sort_index()
+        for pattern in _EQUITY_PATTERNS:
+            eq_row = find_row_label(balance_sheet.index, _EQUITY_LABELS, pattern)
+            if eq_row is not None:
+                eq_series = statement_row(balance_sheet, eq_row).dropna()
                 if not eq_series.empty:
                     equity_val = float(eq_series.iloc[-1])
                 break
@@ -170,8 +117,6 @@ def evaluate_a(
                annual_growth is most recent year decimal,
                roe is return on equity decimal
     """
-    import numpy as np
-
     a_growth_target = a_growth_target or settings.A_GROWTH_TARGET
     annual_growth = None
     roe = None
@@ -180,12 +125,12 @@ def evaluate_a(
         return 0.0, None, None
 
     try:
-        row_label = _find_earnings_row(annual_income)
+        row_label = find_earnings_row(annual_income)
         if row_label is None:
             return 0.0, None, None
 
-        # Sort columns by date oldest→newest so iloc[-1] is most recent
-        earnings = annual_income.loc[row_label].sort_index()
+        # Periods ordered oldest→newest so [-1] is most recent
+        earnings = statement_row(annual_income, row_label).to_numpy()
 
         if len(earnings) < 2:
             return 0.0, None, None
@@ -199,7 +144,7 @@ def evaluate_a(
         annual_growth = yoy_growths[0]  # Most recent year
 
         # Component 1 (50%): Most recent year growth vs target
-        growth_score = float(np.clip(annual_growth / a_growth_target, 0, 2) / 2)
+        growth_score = score_from_growth(annual_growth, a_growth_target)
 
         # Component 2 (30%): Consistency — how many of last 3 years show 25%+ growth
         # O'Neil wants 3-5 years of consistent growth
@@ -216,7 +161,7 @@ def evaluate_a(
             roe = _calculate_roe(annual_income, balance_sheet)
             if roe is not None:
                 roe_target = settings.A_ROE_TARGET
-                roe_score = float(np.clip(roe / roe_target, 0, 2) / 2)
+                roe_score = score_from_growth(roe, roe_target)
 
         # Weighted combination
         score = (
@@ -224,7 +169,7 @@ def evaluate_a(
             + settings.A_CONSISTENCY_WEIGHT * consistency_score
             + settings.A_ROE_WEIGHT * roe_score
         )
-        score = float(np.clip(score, 0, 1))
+        score = min(max(score, 0.0), 1.0)
 
         return score, annual_growth, roe
 
@@ -11,81 +11,32 @@ Priority: EPS (Basic or Diluted) first, then fallback to Net Income.
 
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import List, Optional, Sequence
 
+import numpy as np
 import pandas as pd
 
 from config import settings
 
+from ._growth import growths_to_list, safe_growth, safe_growth_vec, score_from_growth
+from ._labels import find_earnings_row, statement_row
 
-def _safe_growth(current: float, previous: float) -> Optional[float]:
-    """Calculate growth as a decimal, handling edge cases."""
-    if current is None or previous in (None, 0):
-        return None
 
-    try:
-        current = float(current)
-        previous = float(previous)
-    except (TypeError, ValueError):
-        return None
-
-    import numpy as np
-
-    if previous < 0 or np.isclose(previous, 0.0):
-        return None
-
-    try:
-        return (current - previous) / abs(previous)
-    except ZeroDivisionError:
-        return None
-
-
-def _find_earnings_row(df: pd.DataFrame) -> Optional[str]:
-    """Find the best earnings row label using fuzzy matching.
-
-    Priority:
-        1. Basic EPS or Diluted EPS
-        2. Net Income (fallback)
-
-    Args:
-        df: Income statement DataFrame with row labels as index.
-
-    Returns:
-        The matching index label, or None if nothing found.
-
-    """
-    # Priority 1: EPS rows
-    eps_mask = df.index.str.contains(r"Basic EPS|Diluted EPS", case=False, regex=True)
-    if eps_mask.any():
-        return df.index[eps_mask][0]
-
-    # Priority 2: Net Income
-    ni_mask = df.index.str.contains(r"Net Income", case=False, regex=True)
-    if ni_mask.any():
-        return df.index[ni_mask][0]
-
-    return None
-
-
-def _get_quarterly_yoy_growths(earnings: pd.Series) -> List[Optional[float]]:
+def _get_quarterly_yoy_growths(earnings: Sequence[float]) -> List[Optional[float]]:
     """Calculate year-over-year growth for each quarter.
 
     Compares each quarter to the same quarter one year prior (4 quarters back).
 
     Args:
-        earnings: Time-sorted earnings series (oldest to newest).
+        earnings: Time-sorted earnings values (oldest to newest).
 
     Returns:
         List of YoY growth rates for available quarters (most recent first).
 
     """
-    growths = []
-    n = len(earnings)
-    # Start from most recent, go backwards
-    for i in range(n - 1, 3, -1):  # Need at least 4 quarters back
-        growth = _safe_growth(earnings.iloc[i], earnings.iloc[i - 4])
-        growths.append(growth)
-    return growths
+    values = np.asarray(earnings, dtype=np.float64)
+    # Each quarter vs the quarter 4 back, most recent first
+    return growths_to_list(safe_growth_vec(values[4:], values[:-4])[::-1])
 
 
 def _check_acceleration(growths: List[Optional[float]]) -> float:
@@ -140,87 +91,86 @@ def evaluate_c(
         tuple: (score, current_growth) where score is 0-1 and current_growth is decimal
 
     """
-    import numpy as np
-
     c_growth_target = c_growth_target or settings.C_GROWTH_TARGET
-    current_growth = None
 
     if quarterly_income.empty:
         return 0.0, None
 
+    row_label = find_earnings_row(quarterly_income)
+    if row_label is None:
+        return 0.0, None
+
+    # Periods ordered oldest→newest so [-1] is most recent; the
+    # growth math indexes the plain values rather than the Series.
+    # A row with non-numeric cells can't be scored.
+    earnings = statement_row(quarterly_income, row_label)
     try:
-        row_label = _find_earnings_row(quarterly_income)
-        if row_label is None:
-            return 0.0, None
-
-        # Sort columns by date oldest→newest so iloc[-1] is most recent
-        earnings = quarterly_income.loc[row_label].sort_index()
-
-        if len(earnings) < 5:
-            # Standard path needs 5 quarters for true YoY (current + 4 back).
-            # FMP free-tier often returns exactly 4 quarterly periods.
-            # When those 4 periods span ≥ 11 months (e.g., Q4 2023 → Q3 2024),
-            # the oldest and newest entries are effectively the same calendar
-            # quarter one year apart — we can compute a genuine YoY.
-            # Do NOT fall back to quarter-over-quarter; O'Neil strictly requires
-            # YoY to avoid seasonal distortion.
-            if len(earnings) == 4:
-                try:
-                    dates = pd.to_datetime(earnings.index)
-                    span_days = (dates[-1] - dates[0]).days
-                    if span_days >= 330:  # ≥ 11 months → valid approximate YoY
-                        current_growth = _safe_growth(float(earnings.iloc[-1]), float(earnings.iloc[0]))
-                        if current_growth is not None:
-                            growth_score = float(np.clip(current_growth / c_growth_target, 0, 2) / 2)
-                            # Consistency and acceleration are unknown with a single
-                            # YoY data point — score them neutral (0.5) rather than 0.
-                            score = float(
-                                np.clip(
-                                    settings.C_GROWTH_WEIGHT * growth_score
-                                    + settings.C_CONSISTENCY_WEIGHT * 0.5
-                                    + settings.C_ACCELERATION_WEIGHT * 0.5,
-                                    0,
-                                    1,
-                                )
-                            )
-                            return score, current_growth
-                except Exception:
-                    pass
-            return 0.0, None
-
-        # --- O'Neil's methodology: Year-over-Year comparison ---
-        # Compare most recent quarter to same quarter last year (4 quarters back)
-        yoy_growths = _get_quarterly_yoy_growths(earnings)
-
-        if not yoy_growths or yoy_growths[0] is None:
-            return 0.0, None
-
-        current_growth = yoy_growths[0]  # Most recent quarter YoY
-
-        # Component 1 (60%): Current quarter growth vs target
-        # 25%+ growth = full score, scales linearly
-        growth_score = float(np.clip(current_growth / c_growth_target, 0, 2) / 2)
-
-        # Component 2 (20%): Consistency — how many recent quarters show 25%+ growth
-        valid_growths = [g for g in yoy_growths[:3] if g is not None]
-        if valid_growths:
-            quarters_above_target = sum(1 for g in valid_growths if g >= c_growth_target)
-            consistency_score = quarters_above_target / len(valid_growths)
-        else:
-            consistency_score = 0.0
-
-        # Component 3 (20%): Acceleration — are growth rates increasing?
-        acceleration_score = _check_acceleration(yoy_growths[:4])
-
-        # Weighted combination
-        score = (
-            settings.C_GROWTH_WEIGHT * growth_score
-            + settings.C_CONSISTENCY_WEIGHT * consistency_score
-            + settings.C_ACCELERATION_WEIGHT * acceleration_score
-        )
-        score = float(np.clip(score, 0, 1))
-
-        return score, current_growth
-
-    except Exception:
-        return 0.0, current_growth
+        values = earnings.to_numpy(dtype=np.float64)
+    except (TypeError, ValueError):
+        return 0.0, None
+
+    if len(earnings) < 5:
+        # Standard path needs 5 quarters for true YoY (current + 4 back).
+        # FMP free-tier often returns exactly 4 quarterly periods.
+        # When those 4 periods span ≥ 11 months (e.g., Q4 2023 → Q3 2024),
+        # the oldest and newest entries are effectively the same calendar
+        # quarter one year apart — we can compute a genuine YoY.
+        # Do NOT fall back to quarter-over-quarter; O'Neil strictly requires
+        # YoY to avoid seasonal distortion.
+        if len(earnings) == 4:
+            try:
+                dates = pd.to_datetime(earnings.index)
+                span_days = (dates[-1] - dates[0]).days
+            except (TypeError, ValueError):
+                span_days = 0  # Period labels that don't parse as dates leave the span unknown
+            if span_days >= 330:  # ≥ 11 months → valid approximate YoY
+                current_growth = safe_growth(values[-1], values[0])
+                if current_growth is not None:
+                    growth_score = score_from_growth(current_growth, c_growth_target)
+                    # Consistency and acceleration are unknown with a single
+                    # YoY data point — score them neutral (0.5) rather than 0.
+                    score = min(
+                        max(
+                            settings.C_GROWTH_WEIGHT * growth_score
+                            + settings.C_CONSISTENCY_WEIGHT * 0.5
+                            + settings.C_ACCELERATION_WEIGHT * 0.5,
+                            0.0,
+                        ),
+                        1.0,
+                    )
+                    return score, current_growth
+        return 0.0, None
+
+    # --- O'Neil's methodology: Year-over-Year comparison ---
+    # Compare most recent quarter to same quarter last year (4 quarters back)
+    yoy_growths = _get_quarterly_yoy_growths(values)
+
+    if not yoy_growths or yoy_growths[0] is None:
+        return 0.0, None
+
+    current_growth = yoy_growths[0]  # Most recent quarter YoY
+
+    # Component 1 (60%): Current quarter growth vs target
+    # 25%+ growth = full score, scales linearly
+    growth_score = score_from_growth(current_growth, c_growth_target)
+
+    # Component 2 (20%): Consistency — how many recent quarters show 25%+ growth
+    valid_growths = [g for g in yoy_growths[:3] if g is not None]
+    if valid_growths:
+        quarters_above_target = sum(1 for g in valid_growths if g >= c_growth_target)
+        consistency_score = quarters_above_target / len(valid_growths)
+    else:
+        consistency_score = 0.0
+
+    # Component 3 (20%): Acceleration — are growth rates increasing?
+    acceleration_score = _check_acceleration(yoy_growths[:4])
+
+    # Weighted combination
+    score = (
+        settings.C_GROWTH_WEIGHT * growth_score
+        + settings.C_CONSISTENCY_WEIGHT * consistency_score
+        + settings.C_ACCELERATION_WEIGHT * acceleration_score
+    )
+    score = min(max(score, 0.0), 1.0)
+
+    return score, current_growth
@@ -14,8 +14,13 @@ Composite scoring uses O'Neil-weighted averages, not equal weights.
 
 from __future__ import annotations
 
-from typing import Dict, Optional
+import atexit
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, Mapping, Optional
 
+import numpy as np
 import pandas as pd
 
 from config import settings
@@ -27,8 +32,10 @@ from core.data_client import (
     fetch_company_info,
     fetch_ohlcv,
     fetch_quarterly_income_statement,
+    last_completed_session_date,
     normalize_price_dataframe,
 )
+from core.score_cache import load_score, save_score
 
 from .a_annual_earnings import evaluate_a
 from .c_current_earnings import evaluate_c
@@ -38,10 +45,34 @@ from .m_market_direction import MarketTrend, evaluate_m
 from .n_new_products import evaluate_n
 from .s_supply_demand import evaluate_s
 
+_fundamentals_executor: Optional[ThreadPoolExecutor] = None
+_fundamentals_executor_lock = threading.Lock()
+
+
+def _get_fundamentals_executor() -> ThreadPoolExecutor:
+    """Return the fetch pool shared by every ``evaluate_canslim`` call, creating it on first use.
+
+    Sharing it means a screener scoring symbols on its own pool still has at
+    most HTTP_MAX_WORKERS fundamental fetches in flight (well inside the FMP
+    session's connection pool) and pays no per-symbol pool setup.
+    """
+    global _fundamentals_executor
+    with _fundamentals_executor_lock:
+        if _fundamentals_executor is None:
+            _fundamentals_executor = ThreadPoolExecutor(max_workers=settings.HTTP_MAX_WORKERS, thread_name_prefix="fmp")
+            atexit.register(_fundamentals_executor.shutdown, cancel_futures=True)
+        return _fundamentals_executor
+
+
+@lru_cache(maxsize=8)
+def _default_market_trend(cache_bucket: str) -> MarketTrend:
+    """Benchmark market trend for callers that don't pass one, computed once per ``cache_bucket`` (a session date)."""
+    return evaluate_m()
+
 
 def evaluate_canslim(
     symbol: str,
-    rs_scores_df: pd.DataFrame,
+    rs_scores_df: pd.DataFrame | Mapping[str, float],
     market_trend: Optional[MarketTrend] = None,
     period: Optional[str] = None,
     c_growth_target: Optional[float] = None,
@@ -60,7 +91,8 @@ def evaluate_canslim(
 
     Args:
         symbol: Stock ticker symbol
-        rs_scores_df: DataFrame containing pre-calculated RS scores
+        rs_scores_df: DataFrame containing pre-calculated RS scores, or its
+            ticker mapping from ``rs_score_lookup``
         market_trend: Pre-calculated market trend (or will evaluate SPY)
         period: Historical data period to analyze
         c_growth_target: Target for current quarterly earnings growth
@@ -80,15 +112,43 @@ def evaluate_canslim(
     n_revenue_weight = n_revenue_weight or settings.N_REVENUE_GROWTH_WEIGHT
     n_proximity_weight = n_proximity_weight or settings.N_PROXIMITY_TO_HIGH_WEIGHT
 
+    # 0. Market trend and RS come from the whole universe, so with the targets
+    # above they key the per-session score cache; reuse an evaluation if one exists
+    if market_trend is None:
+        market_trend = _default_market_trend(last_completed_session_date().isoformat())
+        if market_trend.latest_close is None:
+            # Benchmark fetch failed; don't pin the neutral fallback for the rest of the day
+            _default_market_trend.cache_clear()
+    score_l, rs_score = evaluate_l(symbol, rs_scores_df)
+    cache_inputs = (
+        rs_score,
+        market_trend,
+        period,
+        c_growth_target,
+        a_growth_target,
+        n_revenue_weight,
+        n_proximity_weight,
+    )
+    cached = load_score(symbol, cache_inputs)
+    if cached is not None:
+        return cached
+
     # 1. Fetch Fundamental Data with Error Handling
+    # The four FMP endpoints are independent, so they are requested concurrently
+    # and a cold symbol waits for the slowest call rather than the sum of all four.
     income_statement_error = None
     balance_sheet_error = None
+    executor = _get_fundamentals_executor()
+    company_info_future = executor.submit(fetch_company_info, symbol)
+    quarterly_future = executor.submit(fetch_quarterly_income_statement, symbol)
+    annual_future = executor.submit(fetch_annual_income_statement, symbol)
+    balance_sheet_future = executor.submit(fetch_balance_sheet, symbol)
     try:
-        company_info = fetch_company_info(symbol)
+        company_info = company_info_future.result()
 
         try:
-            quarterly_income = fetch_quarterly_income_statement(symbol)
-            annual_income = fetch_annual_income_statement(symbol)
+            quarterly_income = quarterly_future.result()
+            annual_income = annual_future.result()
         except Exception as e:
             print(f"[WARN] {symbol}: Failed to fetch income statements: {e}")
             income_statement_error = str(e)
@@ -96,20 +156,22 @@ def evaluate_canslim(
             annual_income = pd.DataFrame()
 
         try:
-            balance_sheet = fetch_balance_sheet(symbol)
+            balance_sheet = balance_sheet_future.result()
         except Exception as e:
             print(f"[WARN] {symbol}: Failed to fetch balance sheet: {e}")
             balance_sheet_error = str(e)
             balance_sheet = pd.DataFrame()
     except Exception as e:
         print(f"Data fetch error for {symbol}: {e}")
+        # Don't spend FMP quota on statements that will never be scored
+        for future in (quarterly_future, annual_future, balance_sheet_future):
+            future.cancel()
         return None
 
     if quarterly_income.empty and annual_income.empty:
         print(f"[WARN] {symbol}: No fundamental data available — C and A scores will be 0")
 
-    # 2. Market Trend & Price History
-    market_trend = market_trend or evaluate_m()
+    # 2. Price History
     try:
         price_history = fetch_ohlcv(symbol, period=period)
     except Exception:
@@ -120,14 +182,15 @@ def evaluate_canslim(
 
     # 3. Extract price and volume metrics
     price_history = normalize_price_dataframe(price_history)
-    closes = extract_float_series(price_history, "Close")
-    latest_close = coerce_scalar(closes.iloc[-1])
-    high_52 = coerce_scalar(closes.max())
+    closes = extract_float_series(price_history, "Close").to_numpy()
+    latest_close = coerce_scalar(closes[-1])
+    # 52-week high: last 252 trading days, however long ``period`` is (as in the backtest)
+    high_52 = coerce_scalar(np.nanmax(closes[-252:]))
     proximity_to_high = latest_close / high_52 if high_52 else 0.0
 
     # Volume
-    volume_series = extract_float_series(price_history, "Volume")
-    avg_volume_50 = float(volume_series.tail(50).mean()) if not volume_series.empty else 0.0
+    volumes = extract_float_series(price_history, "Volume").to_numpy()
+    avg_volume_50 = float(np.nanmean(volumes[-50:])) if volumes.size else 0.0
 
     # Shares Outstanding from FMP
     shares_outstanding = company_info.get("shares_outstanding")
@@ -146,8 +209,7 @@ def evaluate_canslim(
     # S - Supply and Demand (float, up/down volume, breakout, power gap)
     score_s, s_metrics = evaluate_s(price_history, avg_volume_50, latest_close, high_52, shares_outstanding)
 
-    # L - Leader or Laggard
-    score_l, rs_score = evaluate_l(symbol, rs_scores_df)
+    # L - Leader or Laggard (scored in step 0)
 
     # I - Institutional Sponsorship (sweet-spot + trend)
     held_percent_institutions = company_info.get("held_percent_institutions")
@@ -233,7 +295,7 @@ def evaluate_canslim(
         "balance_sheet_error": balance_sheet_error,
     }
 
-    return {
+    result = {
         "symbol": symbol,
         "scores": scores,
         "base_weights": weights,
@@ -247,3 +309,8 @@ def evaluate_canslim(
         "is_breakout": s_metrics.get("is_breakout", False),
         "has_volume_surge": s_metrics.get("has_volume_surge", False),
     }
+    # Degraded results (fetch errors, quota-exhausted fundamentals) are left
+    # uncached so the next run retries them
+    if has_fundamentals and income_statement_error is None and balance_sheet_error is None:
+        save_score(symbol, cache_inputs, result)
+    return result
@@ -16,8 +16,6 @@ from __future__ import annotations
 
 from typing import Optional
 
-import numpy as np
-
 from config import settings
 
 
@@ -140,4 +138,4 @@ def evaluate_i(
     total_weight = sum(weight for weight, _ in active_components)
     score = sum((weight / total_weight) * component for weight, component in active_components)
 
-    return float(np.clip(score, 0, 1))
+    return min(max(score, 0.0), 1.0)
@@ -6,17 +6,20 @@ RS compares a stock's performance against the market benchmark over multiple qua
 
 from __future__ import annotations
 
+from typing import Mapping
+
 import pandas as pd
 
 from core.momentum_analysis import calculate_rs_momentum
 
 
-def evaluate_l(symbol: str, rs_scores_df: pd.DataFrame) -> tuple[float, float]:
+def evaluate_l(symbol: str, rs_scores_df: pd.DataFrame | Mapping[str, float]) -> tuple[float, float]:
     """Evaluate L (Leader or Laggard) score based on Relative Strength.
 
     Args:
         symbol: Stock ticker symbol
-        rs_scores_df: DataFrame containing pre-calculated RS scores for all symbols
+        rs_scores_df: DataFrame containing pre-calculated RS scores for all symbols,
+            or its ticker mapping from ``rs_score_lookup``
 
     Returns:
         tuple: (score, rs_score) where score is 0-1 and rs_score is 1-99
@@ -28,9 +28,14 @@ from core.data_client import (
 )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MarketTrend:
-    """Lightweight representation of the general market trend."""
+    """Lightweight representation of the general market trend.
+
+    Built once per scan and shared by every symbol's evaluation (and pickled
+    into the score cache), so it is immutable and carries no per-instance
+    ``__dict__``.
+    """
 
     symbol: str
     score: float
@@ -41,8 +46,45 @@ class MarketTrend:
     follow_through: bool = False
 
 
+def _daily_changes(closes: np.ndarray) -> np.ndarray:
+    """Return day-over-day fractional changes; NaN where the prior close is unusable."""
+    prev = closes[:-1]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        changes = (closes[1:] - prev) / prev
+    changes[~(prev > 0)] = np.nan
+    return changes
+
+
+def _distribution_day_count(changes: np.ndarray, volume_up: np.ndarray, min_decline: float) -> int:
+    """Count days that closed down at least ``min_decline`` on higher volume."""
+    return int(np.count_nonzero((changes <= -min_decline) & volume_up))
+
+
+def _has_follow_through(changes: np.ndarray, volume_up: np.ndarray, min_rally_pct: float, min_rally_day: int) -> bool:
+    """Return True if any day qualifies as a follow-through day of a rally attempt.
+
+    An attempted rally counts up days; only a meaningful decline (< -1%)
+    resets it (O'Neil allows some down days within a rally attempt — here
+    we're conservative). Flat or mildly down days leave the count as is.
+    The rally day count is therefore the number of up days since the most
+    recent reset, which cumsum + running max express without a Python loop.
+    """
+    up_days = changes > 0
+    resets = changes < -0.01
+    ups_so_far = np.cumsum(up_days)
+    ups_at_last_reset = np.maximum.accumulate(np.where(resets, ups_so_far, 0))
+    rally_day_count = ups_so_far - ups_at_last_reset
+
+    # Follow-through: day 4+ with 1.5%+ gain on higher volume
+    is_follow_through = up_days & (rally_day_count >= min_rally_day) & (changes >= min_rally_pct) & volume_up
+    return bool(is_follow_through.any())
+
+
 def _count_distribution_days(
-    closes: pd.Series, volumes: pd.Series, lookback: int = 25, min_decline: float = 0.002
+    closes: pd.Series | np.ndarray,
+    volumes: pd.Series | np.ndarray,
+    lookback: int = 25,
+    min_decline: float = 0.002,
 ) -> int:
     """Count distribution days in the recent lookback period.
 
@@ -63,31 +105,13 @@ def _count_distribution_days(
         Number of distribution days found.
 
     """
-    if len(closes) < lookback + 1:
-        lookback = len(closes) - 1
-
-    recent_closes = closes.iloc[-(lookback + 1) :]
-    recent_volumes = volumes.iloc[-(lookback + 1) :]
-
-    dist_count = 0
-    for i in range(1, len(recent_closes)):
-        prev = recent_closes.iloc[i - 1]
-        if prev <= 0 or pd.isna(prev):
-            continue
-        price_change = (recent_closes.iloc[i] - prev) / prev
-        vol_today = recent_volumes.iloc[i]
-        vol_yesterday = recent_volumes.iloc[i - 1]
-
-        # Distribution day: decline ≥ 0.2% on higher volume
-        if price_change <= -min_decline and vol_today > vol_yesterday:
-            dist_count += 1
-
-    return dist_count
+    dist_days, _ = _scan_market_days(closes, volumes, dist_lookback=lookback, min_decline=min_decline)
+    return dist_days
 
 
 def _detect_follow_through_day(
-    closes: pd.Series,
-    volumes: pd.Series,
+    closes: pd.Series | np.ndarray,
+    volumes: pd.Series | np.ndarray,
     min_rally_pct: float = 0.015,
     min_rally_day: int = 4,
     lookback: int = 30,
@@ -112,44 +136,69 @@ def _detect_follow_through_day(
         True if a recent follow-through day was detected.
 
     """
-    if len(closes) < 5:
-        return False
-
-    recent_closes = closes.tail(lookback)
-    recent_volumes = volumes.tail(lookback)
-
-    # Find attempted rallies: sequences of up days after a decline
-    rally_day_count = 0
-    in_rally = False
-
-    for i in range(1, len(recent_closes)):
-        prev_close = recent_closes.iloc[i - 1]
-        if prev_close <= 0 or pd.isna(prev_close):
-            continue
-        daily_change = (recent_closes.iloc[i] - prev_close) / prev_close
-
-        if daily_change > 0:
-            if not in_rally:
-                in_rally = True
-                rally_day_count = 1
-            else:
-                rally_day_count += 1
-
-            # Check for follow-through: day 4+ with 1.5%+ gain on higher volume
-            if (
-                rally_day_count >= min_rally_day
-                and daily_change >= min_rally_pct
-                and recent_volumes.iloc[i] > recent_volumes.iloc[i - 1]
-            ):
-                return True
-        else:
-            # Down day resets rally count (though O'Neil allows some down days
-            # within a rally attempt — here we're conservative)
-            if daily_change < -0.01:  # Only reset on meaningful decline
-                in_rally = False
-                rally_day_count = 0
-
-    return False
+    _, has_follow_through = _scan_market_days(
+        closes, volumes, min_rally_pct=min_rally_pct, min_rally_day=min_rally_day, ftd_lookback=lookback
+    )
+    return has_follow_through
+
+
+def _scan_market_days(
+    closes: pd.Series | np.ndarray,
+    volumes: pd.Series | np.ndarray,
+    dist_lookback: int = 25,
+    min_decline: float = 0.002,
+    min_rally_pct: float = 0.015,
+    min_rally_day: int = 4,
+    ftd_lookback: int = 30,
+) -> tuple[int, bool]:
+    """Count distribution days and detect a follow-through day in one pass.
+
+    Both signals only look at the recent tail, so that tail is converted to
+    arrays and its daily changes / volume comparisons are computed once and
+    shared (see ``_count_distribution_days`` and ``_detect_follow_through_day``
+    for the rules).
+
+    Returns:
+        (distribution_days, has_follow_through)
+
+    """
+    all_closes = np.asarray(closes, dtype=np.float64)
+    window = max(dist_lookback + 1, ftd_lookback)
+    closes_arr = all_closes[-window:]
+    volumes_arr = np.asarray(volumes, dtype=np.float64)[-window:]
+    n_changes = len(closes_arr) - 1
+    if n_changes < 1:
+        return 0, False
+
+    changes = _daily_changes(closes_arr)
+    volume_up = volumes_arr[1:] > volumes_arr[:-1]
+
+    dist_n = min(dist_lookback, n_changes)
+    dist_days = _distribution_day_count(changes[-dist_n:], volume_up[-dist_n:], min_decline) if dist_n > 0 else 0
+
+    # The follow-through window is the last ``ftd_lookback`` closes; too short a
+    # history (< 5 closes in total) never qualifies.
+    ftd_n = min(ftd_lookback, len(closes_arr)) - 1
+    has_follow_through = (
+        len(all_closes) >= 5
+        and ftd_n > 0
+        and _has_follow_through(changes[-ftd_n:], volume_up[-ftd_n:], min_rally_pct, min_rally_day)
+    )
+    return dist_days, has_follow_through
+
+
+def _ema_last(values: np.ndarray, span: int) -> float:
+    """Return the last value of ``pd.Series(values).ewm(span=span).mean()``.
+
+    pandas' default (``adjust=True``) EMA at the final bar is a decay-weighted
+    mean of every non-NaN value, so it can be read off with one dot product
+    instead of materializing the whole smoothed series.
+    """
+    decay = 1.0 - 2.0 / (span + 1.0)
+    weights = decay ** np.arange(len(values) - 1, -1, -1, dtype=np.float64)
+    valid = ~np.isnan(values)
+    weights = weights[valid]
+    return float(weights @ values[valid] / weights.sum())
 
 
 def evaluate_m(
@@ -189,12 +238,6 @@ def evaluate_m(
     """
     # Load defaults from configuration
     period = period or settings.MARKET_TREND_PERIOD
-    price_above_200_weight = price_above_200_weight or settings.M_PRICE_ABOVE_200EMA_WEIGHT
-    ema_alignment_weight = ema_alignment_weight or settings.M_EMA_ALIGNMENT_WEIGHT
-    rising_50ema_weight = rising_50ema_weight or settings.M_50EMA_RISING_WEIGHT
-    price_above_21_weight = price_above_21_weight or settings.M_PRICE_ABOVE_21EMA_WEIGHT
-    bullish_threshold = bullish_threshold or settings.M_BULLISH_THRESHOLD
-    rising_lookback = rising_lookback or settings.M_50EMA_RISING_LOOKBACK
 
     if price_data is not None:
         data = price_data
@@ -204,7 +247,7 @@ def evaluate_m(
         except Exception:
             data = pd.DataFrame()
 
-    if data.empty or len(data) < 50:
+    if data.empty:
         return MarketTrend(
             symbol=benchmark_symbol,
             score=0.4,
@@ -217,33 +260,108 @@ def evaluate_m(
     closes = extract_float_series(data, "Close")
     volumes = extract_float_series(data, "Volume")
 
-    ema_21 = closes.ewm(span=21).mean()
-    ema_50 = closes.ewm(span=50).mean()
-    ema_200 = closes.ewm(span=200).mean()
-
-    latest_close = coerce_scalar(closes.iloc[-1])
-    latest_ema_21 = coerce_scalar(ema_21.iloc[-1])
-    latest_ema_50 = coerce_scalar(ema_50.iloc[-1])
-    latest_ema_200 = coerce_scalar(ema_200.iloc[-1])
-
-    # --- O'Neil's Distribution Day Count ---
-    dist_days = _count_distribution_days(
+    return score_market_trend(
         closes,
         volumes,
-        lookback=settings.M_DISTRIBUTION_LOOKBACK,
-        min_decline=settings.M_DISTRIBUTION_MIN_DECLINE,
+        benchmark_symbol=benchmark_symbol,
+        price_above_200_weight=price_above_200_weight,
+        ema_alignment_weight=ema_alignment_weight,
+        rising_50ema_weight=rising_50ema_weight,
+        price_above_21_weight=price_above_21_weight,
+        bullish_threshold=bullish_threshold,
+        rising_lookback=rising_lookback,
     )
-    # 0 dist days = full score, 5+ = 0 score
-    max_dist = settings.M_MAX_DISTRIBUTION_DAYS
-    dist_score = max(1.0 - dist_days / max_dist, 0.0)
 
-    # --- O'Neil's Follow-Through Day Detection ---
-    has_follow_through = _detect_follow_through_day(
-        closes,
+
+def score_market_trend(
+    closes: pd.Series | np.ndarray,
+    volumes: pd.Series | np.ndarray,
+    ema_21: Optional[pd.Series | np.ndarray] = None,
+    ema_50: Optional[pd.Series | np.ndarray] = None,
+    ema_200: Optional[pd.Series | np.ndarray] = None,
+    benchmark_symbol: str = "SPY",
+    price_above_200_weight: Optional[float] = None,
+    ema_alignment_weight: Optional[float] = None,
+    rising_50ema_weight: Optional[float] = None,
+    price_above_21_weight: Optional[float] = None,
+    bullish_threshold: Optional[float] = None,
+    rising_lookback: Optional[int] = None,
+) -> MarketTrend:
+    """Score market direction from price, volume and the 21/50/200 EMAs.
+
+    Only each EMA's latest value (and the 50-EMA ``rising_lookback`` bars
+    back) is used. When the EMA series are omitted, just those points are
+    computed from ``closes``. EMAs are causal, so a caller evaluating many
+    as-of dates (e.g. the backtest) can instead compute them once over the
+    full history and pass prefix slices here. Series and plain arrays are
+    both accepted; values are only ever read positionally.
+
+    Args:
+        closes: Benchmark close series, oldest to newest.
+        volumes: Benchmark volume series aligned with ``closes``.
+        ema_21: 21-period EMA of ``closes`` (computed if omitted).
+        ema_50: 50-period EMA of ``closes`` (computed if omitted).
+        ema_200: 200-period EMA of ``closes`` (computed if omitted).
+        benchmark_symbol: Ticker symbol reported on the result.
+        price_above_200_weight: Weight if price > 200-EMA
+        ema_alignment_weight: Weight if EMAs are properly aligned
+        rising_50ema_weight: Weight if 50-EMA is rising
+        price_above_21_weight: Weight if price > 21-EMA
+        bullish_threshold: Minimum score to consider market bullish
+        rising_lookback: Days to check if 50-EMA is rising
+
+    Returns:
+        MarketTrend: Object containing market direction score and details
+
+    """
+    price_above_200_weight = price_above_200_weight or settings.M_PRICE_ABOVE_200EMA_WEIGHT
+    ema_alignment_weight = ema_alignment_weight or settings.M_EMA_ALIGNMENT_WEIGHT
+    rising_50ema_weight = rising_50ema_weight or settings.M_50EMA_RISING_WEIGHT
+    price_above_21_weight = price_above_21_weight or settings.M_PRICE_ABOVE_21EMA_WEIGHT
+    bullish_threshold = bullish_threshold or settings.M_BULLISH_THRESHOLD
+    rising_lookback = rising_lookback or settings.M_50EMA_RISING_LOOKBACK
+
+    close_values = np.asarray(closes, dtype=np.float64)
+    if len(close_values) < 50:
+        return MarketTrend(
+            symbol=benchmark_symbol,
+            score=0.4,
+            is_bullish=False,
+            latest_close=None,
+            indicators={},
+        )
+
+    latest_close = coerce_scalar(close_values[-1])
+    if ema_21 is None or ema_50 is None or ema_200 is None:
+        latest_ema_21 = _ema_last(close_values, 21)
+        latest_ema_50 = _ema_last(close_values, 50)
+        latest_ema_200 = _ema_last(close_values, 200)
+        ema_50_lookback = (
+            _ema_last(close_values[: len(close_values) - rising_lookback + 1], 50)
+            if len(close_values) > rising_lookback
+            else None
+        )
+    else:
+        ema_50_values = np.asarray(ema_50, dtype=np.float64)
+        latest_ema_21 = coerce_scalar(np.asarray(ema_21, dtype=np.float64)[-1])
+        latest_ema_50 = coerce_scalar(ema_50_values[-1])
+        latest_ema_200 = coerce_scalar(np.asarray(ema_200, dtype=np.float64)[-1])
+        ema_50_lookback = (
+            coerce_scalar(ema_50_values[-rising_lookback]) if len(ema_50_values) > rising_lookback else None
+        )
+
+    # --- O'Neil's Distribution Day Count and Follow-Through Day Detection ---
+    dist_days, has_follow_through = _scan_market_days(
+        close_values,
         volumes,
+        dist_lookback=settings.M_DISTRIBUTION_LOOKBACK,
+        min_decline=settings.M_DISTRIBUTION_MIN_DECLINE,
         min_rally_pct=settings.M_FOLLOW_THROUGH_MIN_PCT,
         min_rally_day=settings.M_FOLLOW_THROUGH_MIN_DAY,
     )
+    # 0 dist days = full score, 5+ = 0 score
+    max_dist = settings.M_MAX_DISTRIBUTION_DAYS
+    dist_score = max(1.0 - dist_days / max_dist, 0.0)
     ftd_score = 1.0 if has_follow_through else 0.0
 
     # --- EMA-based trend analysis (supporting evidence) ---
@@ -255,10 +373,8 @@ def evaluate_m(
     if latest_ema_21 > latest_ema_50 > latest_ema_200:
         trend_score += ema_alignment_weight
 
-    if len(ema_50) > rising_lookback:
-        ema_50_lookback = coerce_scalar(ema_50.iloc[-rising_lookback])
-        if latest_ema_50 > ema_50_lookback:
-            trend_score += rising_50ema_weight
+    if ema_50_lookback is not None and latest_ema_50 > ema_50_lookback:
+        trend_score += rising_50ema_weight
 
     if latest_close > latest_ema_21:
         trend_score += price_above_21_weight
@@ -271,7 +387,7 @@ def evaluate_m(
         + (1.0 - settings.M_DISTRIBUTION_WEIGHT - settings.M_FOLLOW_THROUGH_WEIGHT) * trend_score
     )
 
-    combined_score = float(np.clip(combined_score, 0, 1))
+    combined_score = float(min(max(combined_score, 0.0), 1.0))
 
     return MarketTrend(
         symbol=benchmark_symbol,
@@ -12,52 +12,18 @@ The 52-week high proximity is the primary signal — stocks making new highs ten
 
 from __future__ import annotations
 
+import re
 from typing import Optional
 
 import pandas as pd
 
 from config import settings
 
+from ._growth import safe_growth, score_from_growth
+from ._labels import find_row_label, statement_row
 
-def _safe_growth(current: float, previous: float) -> Optional[float]:
-    """Calculate YoY revenue growth as a decimal.
-
-    Returns None when previous is negative to enforce the CANSLIM
-    requirement for established, positive earnings growth.
-    """
-    if current is None or previous in (None, 0):
-        return None
-
-    try:
-        current = float(current)
-        previous = float(previous)
-    except (TypeError, ValueError):
-        return None
-
-    import numpy as np
-
-    if np.isclose(previous, 0.0):
-        return None
-
-    # Reject negative prior-period values — transitioning from a loss
-    # to a profit produces misleading growth percentages for CANSLIM.
-    if previous < 0:
-        return None
-
-    try:
-        return (current - previous) / abs(previous)
-    except ZeroDivisionError:
-        return None
-
-
-def _score_from_growth(growth: Optional[float], target: float) -> float:
-    """Convert revenue growth into a 0-1 score."""
-    if growth is None:
-        return 0.0
-
-    import numpy as np
-
-    return float(np.clip(growth / target, 0, 2) / 2)
+_REVENUE_LABELS = ("Total Revenue", "Revenue", "Operating Revenue")
+_REVENUE_PATTERN = re.compile(r"Revenue|Total Revenue", re.IGNORECASE)
 
 
 def evaluate_n(
@@ -88,8 +54,6 @@ def evaluate_n(
     Returns:
         tuple: (score, revenue_growth) where score is 0-1 and revenue_growth is decimal
     """
-    import numpy as np
-
     n_revenue_weight = n_revenue_weight or settings.N_REVENUE_GROWTH_WEIGHT
     n_proximity_weight = n_proximity_weight or settings.N_PROXIMITY_TO_HIGH_WEIGHT
     revenue_growth = None
@@ -97,19 +61,19 @@ def evaluate_n(
     # Calculate revenue growth (YoY quarterly)
     if not quarterly_income.empty:
         try:
-            revenue_row = quarterly_income.index[
-                quarterly_income.index.str.contains("Revenue|Total Revenue", case=False, regex=True)
-            ]
+            revenue_row = find_row_label(quarterly_income.index, _REVENUE_LABELS, _REVENUE_PATTERN)
 
-            if not revenue_row.empty:
-                revs = quarterly_income.loc[revenue_row[0]].sort_index()
+            if revenue_row is not None:
+                revs = statement_row(quarterly_income, revenue_row).to_numpy()
                 if len(revs) >= 4:  # YoY Quarterly
-                    revenue_growth = _safe_growth(revs.iloc[-1], revs.iloc[-4])
+                    revenue_growth = safe_growth(revs[-1], revs[-4])
         except Exception:
             pass
 
     # Revenue score: 25%+ quarterly revenue growth = full score
-    revenue_score = _score_from_growth(revenue_growth, settings.N_REVENUE_GROWTH_TARGET)
+    revenue_score = (
+        score_from_growth(revenue_growth, settings.N_REVENUE_GROWTH_TARGET) if revenue_growth is not None else 0.0
+    )
 
     # Proximity score: O'Neil wants stocks at or near new 52-week highs
     # Within 2% of high = full score, drops off steeply below 85%
@@ -142,6 +106,6 @@ def evaluate_n(
     else:
         score = 0.0
 
-    score = float(np.clip(score, 0, 1))
+    score = min(max(score, 0.0), 1.0)
 
     return score, revenue_growth
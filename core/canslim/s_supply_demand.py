@@ -15,10 +15,10 @@ from __future__ import annotations
 
 from typing import Dict, Optional
 
-import numpy as np
 import pandas as pd
 
 from config import settings
+from core.data_client import extract_float_series
 
 
 def _detect_volume_surge(
@@ -103,8 +103,6 @@ def _detect_power_earnings_gap(
     # Get recent data
     recent = price_history.tail(lookback_days + 1).copy()
 
-    from core.data_client import extract_float_series
-
     volumes = extract_float_series(price_history, "Volume")
     recent_volumes = extract_float_series(recent, "Volume")
     recent_closes = extract_float_series(recent, "Close")
@@ -158,8 +156,6 @@ def _calculate_up_down_volume_ratio(price_history: pd.DataFrame, lookback: int =
     if len(price_history) < lookback:
         lookback = len(price_history)
 
-    from core.data_client import extract_float_series
-
     recent = price_history.tail(lookback).copy()
     closes = extract_float_series(recent, "Close")
     volumes = extract_float_series(recent, "Volume")
@@ -295,7 +291,7 @@ def evaluate_s(
     if s_breakout_proximity <= 0.85:
         proximity_score = 1.0
     else:
-        proximity_score = float(np.clip((proximity - 0.85) / (s_breakout_proximity - 0.85), 0, 1))
+        proximity_score = float(min(max((proximity - 0.85) / (s_breakout_proximity - 0.85), 0.0), 1.0))
     breakout_score = 1.0 if is_breakout else max(proximity_score, 0)
     surge_breakout_score = 0.5 * volume_score + 0.5 * breakout_score
 
@@ -316,7 +312,7 @@ def evaluate_s(
         + settings.S_SURGE_BREAKOUT_WEIGHT * surge_breakout_score
         + settings.S_POWER_GAP_WEIGHT * power_gap_score
     )
-    score = float(np.clip(score, 0, 1))
+    score = float(min(max(score, 0.0), 1.0))
 
     # Compile metrics for reporting
     metrics = {
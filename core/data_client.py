@@ -13,7 +13,8 @@ from __future__ import annotations
 import math
 import threading
 import time
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
 from typing import Any, Dict, List, Optional
 from zoneinfo import ZoneInfo
 
@@ -58,25 +59,36 @@ def _cache_set(key: tuple, value: Any) -> None:
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
-# Fundamentals Disk Cache (daily TTL — saves FMP quota across runs)
+# Disk Caches (daily TTL — saves API quota and download time across runs)
 # ═══════════════════════════════════════════════════════════════════════════════
 
 _FUND_CACHE_DIR = "fundamentals_cache"
 _FUND_CACHE_TTL_HOURS = 24
+_PRICE_CACHE_DIR = "price_cache"
+_PRICE_CACHE_TTL_HOURS = 24
 
 
-def _fund_cache_path(key: tuple) -> str:
+def _disk_cache_path(cache_dir: str, key: tuple) -> str:
     safe = hashlib.md5(str(key).encode()).hexdigest()
-    return os.path.join(_FUND_CACHE_DIR, f"{safe}.pkl")
+    return os.path.join(cache_dir, f"{safe}.pkl")
 
 
-def _fund_cache_get(key: tuple) -> Any:
-    """Load a cached fundamental DataFrame if it exists and is fresh."""
-    path = _fund_cache_path(key)
+def disk_cache_get(cache_dir: str, key: tuple, ttl_hours: float) -> Any:
+    """Load a pickled value if it exists and is younger than ``ttl_hours``.
+
+    Args:
+        cache_dir: Cache directory the value was saved under.
+        key: Cache key; the file name is an md5 of ``str(key)``.
+        ttl_hours: Maximum file age before the entry is treated as missing.
+
+    Returns:
+        The cached value, or ``None`` if it is missing, stale or unreadable.
+    """
+    path = _disk_cache_path(cache_dir, key)
     if not os.path.exists(path):
         return None
     age_hours = (time.time() - os.path.getmtime(path)) / 3600
-    if age_hours > _FUND_CACHE_TTL_HOURS:
+    if age_hours > ttl_hours:
         return None
     try:
         with open(path, "rb") as f:
@@ -85,10 +97,16 @@ def _fund_cache_get(key: tuple) -> Any:
         return None
 
 
-def _fund_cache_set(key: tuple, value: Any) -> None:
-    """Persist a fundamental DataFrame to disk."""
-    os.makedirs(_FUND_CACHE_DIR, exist_ok=True)
-    path = _fund_cache_path(key)
+def disk_cache_set(cache_dir: str, key: tuple, value: Any) -> None:
+    """Pickle a value to disk under ``key``; write failures are ignored.
+
+    Args:
+        cache_dir: Cache directory, created if needed.
+        key: Cache key, as passed to ``disk_cache_get``.
+        value: Picklable value to store.
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+    path = _disk_cache_path(cache_dir, key)
     try:
         with open(path, "wb") as f:
             pickle.dump(value, f)
@@ -96,6 +114,36 @@ def _fund_cache_set(key: tuple, value: Any) -> None:
         pass  # Cache write failure is non-fatal
 
 
+def _fund_cache_path(key: tuple) -> str:
+    return _disk_cache_path(_FUND_CACHE_DIR, key)
+
+
+def _fund_cache_get(key: tuple) -> Any:
+    """Load a cached fundamental DataFrame if it exists and is fresh."""
+    return disk_cache_get(_FUND_CACHE_DIR, key, _FUND_CACHE_TTL_HOURS)
+
+
+def _fund_cache_set(key: tuple, value: Any) -> None:
+    """Persist a fundamental DataFrame to disk."""
+    disk_cache_set(_FUND_CACHE_DIR, key, value)
+
+
+def _price_cache_get(key: tuple) -> Any:
+    """Load cached price bars if they were saved for the current last completed session."""
+    return disk_cache_get(_PRICE_CACHE_DIR, _price_disk_key(key), _PRICE_CACHE_TTL_HOURS)
+
+
+def _price_cache_set(key: tuple, value: Any) -> None:
+    """Persist price bars under the current last completed session."""
+    disk_cache_set(_PRICE_CACHE_DIR, _price_disk_key(key), value)
+
+
+def _price_disk_key(key: tuple) -> tuple:
+    # Daily bars only change once a session closes, so keying on the last
+    # completed session rolls the cache over exactly when new data exists.
+    return key + (last_completed_session_date().isoformat(),)
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # Client Singletons
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -177,6 +225,22 @@ def _drop_incomplete_daily_bar(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
+def last_completed_session_date() -> date:
+    """Return the US/Eastern date of the most recent closed weekday session.
+
+    Daily bars only change once a session closes, so disk caches of
+    price-derived data key on this date to roll over exactly when new data exists.
+    """
+    now_et = datetime.now(tz=_US_EASTERN)
+    session = now_et.date()
+    if now_et.weekday() < 5 and now_et.hour >= 16:
+        return session
+    session -= timedelta(days=1)
+    while session.weekday() >= 5:
+        session -= timedelta(days=1)
+    return session
+
+
 def _get_fmp_session() -> requests.Session:
     """Create a requests session with built-in retry logic."""
     session = requests.Session()
@@ -234,6 +298,47 @@ def _fmp_get(endpoint: str, params: Optional[dict] = None) -> Any:
 # ═══════════════════════════════════════════════════════════════════════════════
 
 
+_OHLCV_BAR_FIELDS = {"Open": "open", "High": "high", "Low": "low", "Close": "close", "Volume": "volume"}
+
+
+def _bar_index(bars: List[Any]) -> pd.DatetimeIndex:
+    """Build the tz-naive timestamp index for a list of Alpaca bars."""
+    index = pd.DatetimeIndex([bar.timestamp for bar in bars], name="timestamp")
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    return index
+
+
+def _bar_field_values(bars: List[Any], field: str) -> np.ndarray:
+    """Read one Alpaca bar field into a float64 array."""
+    return np.fromiter((getattr(bar, field) for bar in bars), dtype=np.float64, count=len(bars))
+
+
+def _bar_field_series(bars: List[Any], field: str) -> pd.Series:
+    """Build a float Series of one Alpaca bar field, indexed by tz-naive bar timestamp."""
+    return pd.Series(_bar_field_values(bars, field), index=_bar_index(bars))
+
+
+def _empty_ohlcv() -> pd.DataFrame:
+    return pd.DataFrame(columns=list(_OHLCV_BAR_FIELDS))
+
+
+def _bars_to_ohlcv(bars: List[Any]) -> pd.DataFrame:
+    """Convert one symbol's Alpaca bar models to the capitalized, tz-naive OHLCV layout.
+
+    Reading the parsed bars directly skips ``BarSet.df``, which dumps every bar
+    to a dict and builds a (symbol, timestamp) MultiIndex only for us to
+    flatten, rename and re-cast it.
+    """
+    if not bars:
+        return _empty_ohlcv()
+    df = pd.DataFrame(
+        {column: _bar_field_values(bars, field) for column, field in _OHLCV_BAR_FIELDS.items()},
+        index=_bar_index(bars),
+    )
+    return _drop_incomplete_daily_bar(df)
+
+
 def fetch_ohlcv(
     symbol: str,
     period: str = "1y",
@@ -249,6 +354,10 @@ def fetch_ohlcv(
     cached = _cache_get(cache_key)
     if cached is not None:
         return cached
+    disk = _price_cache_get(cache_key)
+    if disk is not None:
+        _cache_set(cache_key, disk)
+        return disk
 
     client = _get_alpaca_client()
     days = _period_to_days(period)
@@ -264,47 +373,65 @@ def fetch_ohlcv(
     )
 
     barset = client.get_stock_bars(request_params)
-    df = barset.df
+    df = _bars_to_ohlcv(barset.data.get(symbol, []))
+    _cache_set(cache_key, df)
+    if not df.empty:
+        _price_cache_set(cache_key, df)
+    return df
 
-    if df.empty:
-        empty = pd.DataFrame(columns=["Open", "High", "Low", "Close", "Volume"])
-        _cache_set(cache_key, empty)
-        return empty
-
-    # Flatten MultiIndex (symbol, timestamp) → plain DatetimeIndex
-    if isinstance(df.index, pd.MultiIndex):
-        df = df.droplevel("symbol")
-
-    # Rename lowercase Alpaca columns → capitalized yfinance convention
-    df = df.rename(
-        columns={
-            "open": "Open",
-            "high": "High",
-            "low": "Low",
-            "close": "Close",
-            "volume": "Volume",
-        }
-    )
-    df = df[["Open", "High", "Low", "Close", "Volume"]]
 
-    # Strip timezone to match yfinance tz-naive output
-    if df.index.tz is not None:
-        df.index = df.index.tz_localize(None)
+def fetch_ohlcv_bulk(
+    symbols: List[str],
+    period: str = "1y",
+    end_date: Optional[datetime] = None,
+) -> Dict[str, pd.DataFrame]:
+    """Fetch daily OHLCV bars for several tickers in one Alpaca request.
 
-    df = _drop_incomplete_daily_bar(df)
+    Each frame has the same layout as ``fetch_ohlcv`` and is stored under the
+    same session cache key, so later single-symbol calls are cache hits.
+    Symbols with no bars are omitted from the result.
+    """
+    result: Dict[str, pd.DataFrame] = {}
+    missing: List[str] = []
+    for symbol in symbols:
+        cache_key = ("ohlcv", symbol, period, str(end_date))
+        cached = _cache_get(cache_key)
+        if cached is None:
+            cached = _price_cache_get(cache_key)
+            if cached is not None:
+                _cache_set(cache_key, cached)
+        if cached is None:
+            missing.append(symbol)
+        elif not cached.empty:
+            result[symbol] = cached
+
+    if not missing:
+        return result
 
-    df = df.astype(
-        {
-            "Open": float,
-            "High": float,
-            "Low": float,
-            "Close": float,
-            "Volume": float,
-        }
+    client = _get_alpaca_client()
+    days = _period_to_days(period)
+    end = end_date or datetime.now()
+    start = end - timedelta(days=days)
+
+    request_params = StockBarsRequest(
+        symbol_or_symbols=missing,
+        timeframe=TimeFrame.Day,
+        start=start,
+        end=end,
+        adjustment=Adjustment.SPLIT,  # Normalize historical prices across stock splits
     )
 
-    _cache_set(cache_key, df)
-    return df
+    bars_by_symbol = client.get_stock_bars(request_params).data
+
+    for symbol in missing:
+        cache_key = ("ohlcv", symbol, period, str(end_date))
+        formatted = _bars_to_ohlcv(bars_by_symbol.get(symbol, []))
+        _cache_set(cache_key, formatted)
+        if not formatted.empty:
+            _price_cache_set(cache_key, formatted)
+            result[symbol] = formatted
+
+    return result
 
 
 def fetch_bulk_close_prices(
@@ -322,18 +449,23 @@ def fetch_bulk_close_prices(
     cached = _cache_get(cache_key)
     if cached is not None:
         return cached
+    disk = _price_cache_get(cache_key)
+    if disk is not None:
+        _cache_set(cache_key, disk)
+        return disk
 
     client = _get_alpaca_client()
     days = _period_to_days(period)
     end = datetime.now()
     start = end - timedelta(days=days)
 
-    all_frames: List[pd.DataFrame] = []
+    unique_tickers = list(dict.fromkeys(tickers))
+    total_batches = math.ceil(len(unique_tickers) / chunk_size)
+    closes_by_symbol: Dict[str, pd.Series] = {}
 
-    for i in range(0, len(tickers), chunk_size):
-        chunk = tickers[i : i + chunk_size]
+    for i in range(0, len(unique_tickers), chunk_size):
+        chunk = unique_tickers[i : i + chunk_size]
         batch_num = i // chunk_size + 1
-        total_batches = (len(tickers) // chunk_size) + 1
         print(f"Downloading batch {batch_num}/{total_batches} ({len(chunk)} tickers)...")
 
         try:
@@ -345,32 +477,30 @@ def fetch_bulk_close_prices(
                 adjustment=Adjustment.SPLIT,  # Normalize RS calculation across stock splits
             )
             barset = client.get_stock_bars(request_params)
-            df = barset.df
+            # Read closes straight from the parsed bars; barset.df would
+            # model_dump every bar and build a (symbol, timestamp) MultiIndex first
+            chunk_closes = {symbol: _bar_field_series(bars, "close") for symbol, bars in barset.data.items() if bars}
 
-            if df.empty:
+            if not chunk_closes:
                 print(f"  Batch {batch_num} returned empty data, skipping.")
                 continue
 
-            # Pivot from MultiIndex (symbol, timestamp) to wide: date × ticker
-            close_series = df["close"].unstack(level="symbol")
-
-            if close_series.index.tz is not None:
-                close_series.index = close_series.index.tz_localize(None)
-
-            close_series = _drop_incomplete_daily_bar(close_series)
-
-            all_frames.append(close_series)
+            closes_by_symbol.update(chunk_closes)
             time.sleep(0.5)  # respect Alpaca rate limits
         except Exception as e:
             print(f"  Batch {batch_num} failed: {e}")
             continue
 
-    if not all_frames:
+    if not closes_by_symbol:
         return pd.DataFrame()
 
-    result = pd.concat(all_frames, axis=1)
+    # Wide date × ticker frame in one construction, aligned on the union of dates
+    result = pd.DataFrame(closes_by_symbol)
+    result = _drop_incomplete_daily_bar(result)
     result = result.dropna(axis=1, how="all")
     _cache_set(cache_key, result)
+    if not result.empty:
+        _price_cache_set(cache_key, result)
     return result
 
 
@@ -532,6 +662,10 @@ def fetch_company_info(symbol: str) -> dict:
     cached = _cache_get(cache_key)
     if cached is not None:
         return cached
+    disk = _fund_cache_get(cache_key)
+    if disk is not None:
+        _cache_set(cache_key, disk)
+        return disk
 
     result: Dict[str, Any] = {
         "shares_outstanding": None,
@@ -552,21 +686,26 @@ def fetch_company_info(symbol: str) -> dict:
     except (requests.RequestException, ValueError, EnvironmentError):
         pass
 
-    # 2. Institutional holders — not available on the stable free tier.
-    # The HTTP 404 is caught below; institutional data gracefully degrades to None
+    # 2. Institutional holders — not available on the stable free tier, so the
+    # request is skipped unless enabled; institutional data then degrades to None
     # and the I-component weight drops to 0.0 in the CANSLIM composite.
-    try:
-        holders = _fmp_get("institutional-holder", {"symbol": symbol})
-        if holders and isinstance(holders, list):
-            result["institution_count"] = len(holders)
+    if settings.FMP_INSTITUTIONAL_HOLDERS_ENABLED:
+        try:
+            holders = _fmp_get("institutional-holder", {"symbol": symbol})
+            if holders and isinstance(holders, list):
+                result["institution_count"] = len(holders)
 
-            if result["shares_outstanding"] and result["shares_outstanding"] > 0:
-                total_held = sum(h.get("shares", 0) for h in holders if h.get("shares"))
-                result["held_percent_institutions"] = min(total_held / result["shares_outstanding"], 1.0)
-    except (requests.RequestException, ValueError, EnvironmentError):
-        pass
+                if result["shares_outstanding"] and result["shares_outstanding"] > 0:
+                    total_held = sum(h.get("shares", 0) for h in holders if h.get("shares"))
+                    result["held_percent_institutions"] = min(total_held / result["shares_outstanding"], 1.0)
+        except (requests.RequestException, ValueError, EnvironmentError):
+            pass
 
     _cache_set(cache_key, result)
+    # Share counts only move on filings/splits, so a successful profile lookup
+    # is reused across runs like the statements instead of re-fetched per scan.
+    if result["shares_outstanding"] is not None:
+        _fund_cache_set(cache_key, result)
     return result
 
 
@@ -581,6 +720,10 @@ def _fetch_fmp_raw_history(symbol: str) -> dict:
     cached_raw = _cache_get(raw_cache_key)
     if cached_raw is not None:
         return cached_raw
+    disk = _fund_cache_get(raw_cache_key)
+    if disk is not None:
+        _cache_set(raw_cache_key, disk)
+        return disk
 
     try:
         qi_raw = _fmp_get("income-statement", {"symbol": symbol, "period": "quarter", "limit": 80})
@@ -612,9 +755,29 @@ def _fetch_fmp_raw_history(symbol: str) -> dict:
         "holders_raw": holders_raw,
     }
     _cache_set(raw_cache_key, result)
+    # _fmp_get returns [] on quota/network errors, so a bundle with any empty
+    # endpoint may be a transient failure; keep it out of the 24h disk cache
+    if qi_raw and ai_raw and bs_raw and profile_raw:
+        _fund_cache_set(raw_cache_key, result)
     return result
 
 
+def prefetch_fundamental_histories(symbols: List[str], max_workers: Optional[int] = None) -> None:
+    """Warm the raw FMP history cache for several symbols in parallel.
+
+    Each symbol costs several independent FMP requests, so fetching the
+    histories concurrently up front lets later ``fetch_fundamental_data_as_of``
+    calls run purely from cache.
+
+    Args:
+        symbols: Ticker symbols to prefetch.
+        max_workers: Thread count (defaults to ``settings.MAX_WORKERS``).
+
+    """
+    with ThreadPoolExecutor(max_workers=max_workers or settings.MAX_WORKERS) as executor:
+        list(executor.map(_fetch_fmp_raw_history, symbols))
+
+
 def _filter_records_as_of(records: List[dict], as_of_date: datetime) -> List[dict]:
     """Keep only records whose SEC-accepted date is on or before *as_of_date*.
 
@@ -786,18 +949,20 @@ def coerce_scalar(value: Any) -> float:
     Raises ``ValueError`` if the result is NaN or infinite so that corrupted
     data surfaces immediately rather than propagating silently through scores.
     """
-    if isinstance(value, pd.DataFrame):
-        if value.shape[1] == 0:
-            raise ValueError("Cannot extract a scalar from an empty DataFrame")
-        value = value.iloc[:, 0]
-    if isinstance(value, pd.Series):
-        if value.empty:
-            raise ValueError("Cannot extract a scalar from an empty Series")
-        value = value.iloc[-1]
-    if isinstance(value, np.ndarray):
-        if value.size == 0:
-            raise ValueError("Cannot extract a scalar from an empty ndarray")
-        value = value.item()
+    # Plain floats and np.float64 (direct ndarray indexing) need no unwrapping
+    if not isinstance(value, float):
+        if isinstance(value, pd.DataFrame):
+            if value.shape[1] == 0:
+                raise ValueError("Cannot extract a scalar from an empty DataFrame")
+            value = value.iloc[:, 0]
+        if isinstance(value, pd.Series):
+            if value.empty:
+                raise ValueError("Cannot extract a scalar from an empty Series")
+            value = value.iloc[-1]
+        if isinstance(value, np.ndarray):
+            if value.size == 0:
+                raise ValueError("Cannot extract a scalar from an empty ndarray")
+            value = value.item()
     result = float(value)
     if not math.isfinite(result):
         raise ValueError(f"coerce_scalar produced non-finite value: {result}")
@@ -805,8 +970,14 @@ def coerce_scalar(value: Any) -> float:
 
 
 def extract_float_series(df: pd.DataFrame, column: str) -> pd.Series:
-    """Extract a named column from *df* as a float64 Series."""
+    """Extract a named column from *df* as a float64 Series.
+
+    Bars are already float64 from ingestion, so the column is returned as is
+    and only other dtypes (e.g. integer volume) pay for a converted copy.
+    """
     if column not in df:
         raise KeyError(f"Column '{column}' not found in dataframe")
     series = ensure_series(df[column])
+    if series.dtype == np.float64:
+        return series
     return series.astype(float)
@@ -2,8 +2,9 @@ from __future__ import annotations
 
 import os
 from datetime import datetime
-from typing import Optional
+from typing import Dict, Mapping, Optional
 
+import numpy as np
 import pandas as pd
 
 from config import settings
@@ -78,6 +79,36 @@ def calculate_weighted_performance(
         return None
 
 
+def _weighted_performance_table(close_prices: pd.DataFrame) -> pd.Series:
+    """Apply ``calculate_weighted_performance`` to every column at once.
+
+    All columns share the same date index, so the five quarter-boundary closes
+    sit at the same rows for every ticker and each return is one array division.
+
+    Args:
+        close_prices: Daily closes, one column per ticker (oldest to newest).
+
+    Returns:
+        Weighted performance per ticker, NaN where it is undefined.
+    """
+    days_per_q = settings.TRADING_DAYS_PER_QUARTER
+    if len(close_prices) < 4 * days_per_q:
+        return pd.Series(np.nan, index=close_prices.columns)
+
+    values = close_prices.to_numpy(dtype=np.float64)
+    latest, q1_start, q2_start, q3_start, q4_start = values[
+        [-1, -days_per_q, -2 * days_per_q, -3 * days_per_q, -4 * days_per_q]
+    ]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        weighted = (
+            (settings.RS_Q1_WEIGHT * (latest / q1_start - 1))
+            + (settings.RS_Q2_WEIGHT * (q1_start / q2_start - 1))
+            + (settings.RS_Q3_WEIGHT * (q2_start / q3_start - 1))
+            + (settings.RS_Q4_WEIGHT * (q3_start / q4_start - 1))
+        )
+    return pd.Series(weighted, index=close_prices.columns)
+
+
 def calculate_rs_scores_for_tickers(
     tickers: list[str],
     cache_file: Optional[str] = None,
@@ -140,7 +171,7 @@ def calculate_rs_scores_for_tickers(
         return pd.DataFrame()
 
     print("Calculating weighted performance...")
-    rs_scores = full_data.apply(calculate_weighted_performance)
+    rs_scores = _weighted_performance_table(full_data)
 
     rs_df = rs_scores.reset_index()
     rs_df.columns = ["Ticker", "Weighted_Perf"]
@@ -155,7 +186,26 @@ def calculate_rs_scores_for_tickers(
     return rs_df
 
 
-def calculate_rs_momentum(symbol: str, rs_scores_df: pd.DataFrame) -> float:
+def rs_score_lookup(rs_scores_df: pd.DataFrame) -> Dict[str, float]:
+    """Index a pre-computed RS scores DataFrame by ticker.
+
+    A scan looks up one score per symbol; building the dict once replaces a
+    boolean mask over the whole universe for every lookup.
+
+    Args:
+        rs_scores_df: DataFrame produced by ``calculate_rs_scores_for_tickers()``.
+
+    Returns:
+        Mapping of ticker to RS score (first row wins on duplicates). Empty if
+        the DataFrame lacks the expected columns.
+    """
+    if rs_scores_df.empty or not {"Ticker", "RS_Score"}.issubset(rs_scores_df.columns):
+        return {}
+    unique = rs_scores_df.drop_duplicates("Ticker")
+    return unique.set_index("Ticker")["RS_Score"].astype(float).to_dict()
+
+
+def calculate_rs_momentum(symbol: str, rs_scores_df: pd.DataFrame | Mapping[str, float]) -> float:
     """Look up a ticker's RS score from a pre-computed RS scores DataFrame.
 
     This function is kept for backward compatibility. Prefer accessing the
@@ -163,11 +213,14 @@ def calculate_rs_momentum(symbol: str, rs_scores_df: pd.DataFrame) -> float:
 
     Args:
         symbol: Ticker symbol to look up.
-        rs_scores_df: DataFrame produced by ``calculate_rs_scores_for_tickers()``.
+        rs_scores_df: DataFrame produced by ``calculate_rs_scores_for_tickers()``,
+            or the ticker mapping from ``rs_score_lookup()`` for O(1) lookups.
 
     Returns:
         RS score (typically 0-100), or 0.0 if the ticker is not found.
     """
+    if not isinstance(rs_scores_df, pd.DataFrame):
+        return float(rs_scores_df.get(symbol, 0.0))
     try:
         score = rs_scores_df[rs_scores_df["Ticker"] == symbol]["RS_Score"].iloc[0]
         return float(score)
@@ -0,0 +1,43 @@
+"""Disk cache for per-symbol CANSLIM evaluations.
+
+Prices are daily bars and fundamentals are cached for a day, so a symbol's
+evaluation only changes once a new session closes (or its inputs change).
+Entries are keyed on the symbol, the caller's scoring inputs, the scoring
+settings and the last completed US/Eastern session, so a re-run on the same
+day (or after a crash) skips recomputation, a config edit takes effect
+immediately, and the cache rolls over when new bars exist.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Optional
+
+from config import settings
+from core.data_client import disk_cache_get, disk_cache_set, last_completed_session_date
+
+_SCORE_CACHE_DIR = settings.SCORE_CACHE_DIR
+_SCORE_CACHE_TTL_HOURS = 24
+
+# Settings read by the component scorers and the composite (targets, thresholds,
+# sub-weights and CANSLIM_WEIGHT_*); any change to them changes total_score.
+_SCORING_SETTING_PREFIXES = ("CANSLIM_", "C_", "A_", "N_", "S_", "I_", "M_")
+
+
+def _scoring_settings() -> tuple:
+    return tuple(
+        sorted((name, value) for name, value in vars(settings).items() if name.startswith(_SCORING_SETTING_PREFIXES))
+    )
+
+
+def _score_key(symbol: str, inputs: tuple) -> tuple:
+    return ("canslim", symbol, inputs, _scoring_settings(), last_completed_session_date().isoformat())
+
+
+def load_score(symbol: str, inputs: tuple) -> Optional[Dict[str, object]]:
+    """Return the cached evaluation of ``symbol`` for ``inputs`` in the current session, if any."""
+    return disk_cache_get(_SCORE_CACHE_DIR, _score_key(symbol, inputs), _SCORE_CACHE_TTL_HOURS)
+
+
+def save_score(symbol: str, inputs: tuple, result: Dict[str, object]) -> None:
+    """Persist an evaluation of ``symbol`` for ``inputs`` under the current session."""
+    disk_cache_set(_SCORE_CACHE_DIR, _score_key(symbol, inputs), result)
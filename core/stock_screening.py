@@ -7,19 +7,41 @@ filtering for stocks with strong fundamentals, technical strength, and market le
 from __future__ import annotations
 
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Dict, Iterable, List, Optional, Tuple
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
 
 import pandas as pd
+import requests
+from alpaca.common.exceptions import APIError
 
 from config.settings import (
+    CANSLIM_DATA_PERIOD,
+    CHUNK_SIZE,
     MAX_WORKERS,
     MIN_CANSLIM_SCORE,
     MIN_RS_SCORE,
     REQUIRE_BULLISH_MARKET_FOR_BUYS,
+    SKIP_SCAN_IN_BEARISH_MARKET,
     WATCHLIST_MIN_CANSLIM_SCORE,
 )
 from core.canslim import MarketTrend, evaluate_canslim, evaluate_market_direction
-from core.momentum_analysis import calculate_rs_scores_for_tickers
+from core.data_client import fetch_ohlcv_bulk
+from core.momentum_analysis import calculate_rs_scores_for_tickers, rs_score_lookup
+
+
+def _prefetch_price_history(symbols: List[str]) -> None:
+    """Warm the session cache with bulk OHLCV requests for the symbols about to be scored.
+
+    ``evaluate_canslim`` reads each symbol's history through ``fetch_ohlcv``,
+    which then hits the cache instead of issuing one request per symbol.
+    A chunk that fails on an Alpaca API, network or credentials error is
+    skipped; its symbols fall back to their own request.
+    """
+    for start in range(0, len(symbols), CHUNK_SIZE):
+        chunk = symbols[start : start + CHUNK_SIZE]
+        try:
+            fetch_ohlcv_bulk(chunk, period=CANSLIM_DATA_PERIOD)
+        except (APIError, requests.RequestException, EnvironmentError) as exc:
+            print(f"[WARN] Bulk price prefetch failed for {len(chunk)} symbols ({chunk[0]}..{chunk[-1]}): {exc}")
 
 
 def _classify_canslim_candidate(
@@ -78,7 +100,7 @@ def evaluate_stock_canslim(
     min_rs_score: float,
     min_canslim_score: float,
     market_trend: MarketTrend,
-    rs_scores_df: pd.DataFrame,
+    rs_scores_df: pd.DataFrame | Mapping[str, float],
     debug: bool = False,
     watchlist_min_score: float = WATCHLIST_MIN_CANSLIM_SCORE,
     require_bullish_market: bool = REQUIRE_BULLISH_MARKET_FOR_BUYS,
@@ -91,7 +113,8 @@ def evaluate_stock_canslim(
         min_rs_score: Minimum RS score threshold
         min_canslim_score: Minimum CANSLIM composite score threshold
         market_trend: Pre-calculated market trend
-        rs_scores_df: DataFrame with pre-calculated RS scores
+        rs_scores_df: DataFrame with pre-calculated RS scores, or its ticker
+            mapping from ``rs_score_lookup``
         debug: Enable verbose output
 
     Returns:
@@ -236,6 +259,7 @@ def screen_stocks_canslim_detailed(
     watchlist_min_score: float = WATCHLIST_MIN_CANSLIM_SCORE,
     require_bullish_market: bool = REQUIRE_BULLISH_MARKET_FOR_BUYS,
     strict_breakout: bool = False,
+    skip_when_bearish: bool = SKIP_SCAN_IN_BEARISH_MARKET,
 ) -> Tuple[List[Dict[str, object]], List[Dict[str, object]], MarketTrend]:
     """Screen multiple stocks for CANSLIM characteristics.
 
@@ -246,6 +270,8 @@ def screen_stocks_canslim_detailed(
         min_rs_score: Minimum relative strength score threshold
         min_canslim_score: Minimum composite CANSLIM score threshold
         debug: Enable verbose output
+        skip_when_bearish: Return no candidates without fetching any per-symbol
+            data when the market is not bullish
 
     Returns:
         Tuple of (actionable_buys, watchlist_candidates, market_trend)
@@ -254,6 +280,12 @@ def screen_stocks_canslim_detailed(
     market_trend = evaluate_market_direction()
     results: List[Dict[str, object]] = []
 
+    # Buys are gated off in a correction anyway; when the watchlist isn't wanted
+    # either, skip the RS download and every per-symbol price/fundamental fetch.
+    if skip_when_bearish and not market_trend.is_bullish:
+        print(f"Market is not bullish (M score={market_trend.score * 100:.0f}%) — skipping per-symbol evaluation.")
+        return [], [], market_trend
+
     # Calculate RS scores for all symbols at once
     symbols_list = list(symbols)
     rs_scores_df = calculate_rs_scores_for_tickers(symbols_list)
@@ -288,18 +320,14 @@ def screen_stocks_canslim_detailed(
 
     # Pre-filter: discard symbols whose RS score is already below the threshold
     # to avoid wasting API calls on weak stocks
+    # The ticker index is built once and shared with every evaluation below
+    rs_lookup = rs_score_lookup(rs_scores_df)
     filtered_symbols = []
     rs_below_threshold = 0
     rs_not_found = 0
     for symbol in symbols_list:
-        try:
-            match = rs_scores_df[rs_scores_df["Ticker"] == symbol]
-            if not match.empty:
-                rs_val = float(match.iloc[0]["RS_Score"])
-            else:
-                rs_val = 0
-                rs_not_found += 1
-        except Exception:
+        rs_val = rs_lookup.get(symbol)
+        if rs_val is None:
             rs_val = 0
             rs_not_found += 1
 
@@ -317,6 +345,9 @@ def screen_stocks_canslim_detailed(
             f"{len(filtered_symbols)}/{len(symbols_list)} passed"
         )
 
+    # One bulk price request per chunk instead of one per symbol
+    _prefetch_price_history(filtered_symbols)
+
     # Evaluate remaining symbols in parallel
     def _evaluate(sym: str) -> Optional[Dict[str, object]]:
         try:
@@ -325,7 +356,7 @@ def screen_stocks_canslim_detailed(
                 min_rs_score=min_rs_score,
                 min_canslim_score=min_canslim_score,
                 market_trend=market_trend,
-                rs_scores_df=rs_scores_df,
+                rs_scores_df=rs_lookup,
                 debug=debug,
                 watchlist_min_score=watchlist_min_score,
                 require_bullish_market=require_bullish_market,
@@ -0,0 +1,221 @@
+"""Tests for the backtest engine — price downloads and FMP fetches are mocked."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import backtest
+from config import settings
+from core.canslim.s_supply_demand import evaluate_s
+from core.momentum_analysis import calculate_weighted_performance
+
+
+def _synthetic_ohlcv(rows: int, seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    closes = 100 * np.exp(np.cumsum(rng.normal(0.0008, 0.02, rows)))
+    opens = closes * (1 + rng.normal(0.002, 0.015, rows))
+    volumes = rng.integers(1_000_000, 5_000_000, rows).astype(float)
+    volumes[rng.random(rows) < 0.05] *= 3
+    return pd.DataFrame(
+        {
+            "Open": opens,
+            "High": np.maximum(opens, closes) * 1.01,
+            "Low": np.minimum(opens, closes) * 0.99,
+            "Close": closes,
+            "Volume": volumes,
+        },
+        index=pd.bdate_range(end=pd.Timestamp.today().normalize() - pd.Timedelta(days=1), periods=rows),
+    )
+
+
+def test_round_column_matches_builtin_round_on_ties() -> None:
+    values = np.array([38.15, 2.675, 0.125, 42.3, -1.25])
+
+    rounded = backtest._round_column(values, 1)
+
+    assert rounded.dtype == np.float64
+    assert rounded.tolist() == [round(v, 1) for v in values.tolist()]
+    assert rounded[0] == 38.1  # np.round gives 38.2 here
+
+
+def test_run_backtest_rounds_canslim_score_like_builtin_round() -> None:
+    """The headline score column uses the same tie rounding as the other output columns."""
+    ohlcv = {"AAA": _synthetic_ohlcv(300, 0), backtest.BENCHMARK: _synthetic_ohlcv(300, 1)}
+    universe = pd.DataFrame({f"X{i}": _synthetic_ohlcv(300, 10 + i)["Close"] for i in range(12)})
+    fundamentals = {
+        "c_score": 0.5,
+        "a_score": 0.5,
+        "i_score": 0.5,
+        "current_growth": 0.3,
+        "annual_growth": 0.3,
+        "roe": 0.2,
+        "shares_outstanding": 1e9,
+    }
+
+    with (
+        patch.object(backtest, "BACKTEST_TICKERS", ["AAA"]),
+        patch.object(backtest, "_download_price_data", return_value=ohlcv),
+        patch.object(backtest, "get_sp500_tickers", return_value=list(universe.columns)),
+        patch.object(backtest, "_download_bulk_closes", return_value=universe),
+        patch.object(backtest, "prefetch_fundamental_histories"),
+        patch.object(backtest, "_evaluate_fundamentals_at_date", return_value=fundamentals),
+        patch.object(backtest, "_compute_canslim_scores", side_effect=lambda c, f: np.full(len(c), 38.15)),
+    ):
+        df = backtest.run_backtest()
+
+    assert not df.empty
+    assert df["CANSLIM_Score"].dtype == np.float64
+    assert (df["CANSLIM_Score"] == 38.1).all()
+
+
+# ─── Parity with the per-date reference calculations ─────────────────────────
+
+
+def _reference_rs_at_date(all_closes: pd.DataFrame, ticker: str, eval_date: pd.Timestamp) -> float:
+    """The per-date RS rank the backtest computed before ``_rs_score_table``."""
+    sliced = all_closes.loc[:eval_date].dropna(axis=1, how="all")
+    if ticker not in sliced.columns:
+        return 0.0
+    perfs = {}
+    for col in sliced.columns:
+        series = sliced[col].dropna()
+        if len(series) < 60:
+            continue
+        wp = calculate_weighted_performance(series)
+        if wp is None:
+            wp = (series.iloc[-1] - series.iloc[0]) / series.iloc[0]
+        perfs[col] = wp
+    if ticker not in perfs or len(perfs) < 10:
+        return 0.0
+    ranks = pd.Series(perfs).rank(pct=True)
+    return float(ranks[ticker] * settings.RS_PERCENTILE_MULTIPLIER + settings.RS_PERCENTILE_MIN)
+
+
+def _reference_canslim_score(components: tuple, has_fundamentals: bool) -> float:
+    """The per-row weighted composite the backtest computed before ``_compute_canslim_scores``."""
+    c, a, n, s, l_score, i, m = components
+    if has_fundamentals:
+        return (
+            settings.CANSLIM_WEIGHT_C * c
+            + settings.CANSLIM_WEIGHT_A * a
+            + settings.CANSLIM_WEIGHT_N * n
+            + settings.CANSLIM_WEIGHT_S * s
+            + settings.CANSLIM_WEIGHT_L * l_score
+            + settings.CANSLIM_WEIGHT_I * i
+            + settings.CANSLIM_WEIGHT_M * m
+        ) * 100
+    tw = (
+        settings.CANSLIM_WEIGHT_N
+        + settings.CANSLIM_WEIGHT_S
+        + settings.CANSLIM_WEIGHT_L
+        + settings.CANSLIM_WEIGHT_I
+        + settings.CANSLIM_WEIGHT_M
+    )
+    return (
+        (settings.CANSLIM_WEIGHT_N / tw) * n
+        + (settings.CANSLIM_WEIGHT_S / tw) * s
+        + (settings.CANSLIM_WEIGHT_L / tw) * l_score
+        + (settings.CANSLIM_WEIGHT_I / tw) * i
+        + (settings.CANSLIM_WEIGHT_M / tw) * m
+    ) * 100
+
+
+def _reference_technicals(ticker_data: pd.DataFrame, eval_date: pd.Timestamp) -> dict:
+    """52-week high, 50-day volume and N score from a label slice, as before the rolling precompute."""
+    sliced = ticker_data.loc[:eval_date]
+    closes = sliced["Close"]
+    latest_close = float(closes.iloc[-1])
+    high_52 = float(closes.iloc[-min(252, len(closes)) :].max())
+    proximity = latest_close / high_52
+    if proximity >= 0.98:
+        n_score = 1.0
+    elif proximity >= 0.90:
+        n_score = (proximity - 0.90) / (0.98 - 0.90)
+    elif proximity >= 0.75:
+        n_score = (proximity - 0.75) / (0.90 - 0.75) * 0.3
+    else:
+        n_score = 0.0
+    return {
+        "close": latest_close,
+        "high_52": high_52,
+        "avg_vol_50": float(sliced["Volume"].tail(50).mean()),
+        "proximity": proximity,
+        "n_score": float(np.clip(n_score, 0, 1)),
+    }
+
+
+def test_rs_score_table_matches_per_date_ranking() -> None:
+    """Covers full-year histories, an IPO on the raw-return fallback, and unranked tickers."""
+    universe = {f"X{i}": _synthetic_ohlcv(400, 20 + i)["Close"] for i in range(14)}
+    closes = pd.DataFrame(universe)
+    closes.loc[closes.index[:250], "X0"] = np.nan  # late listing: raw-return fallback, then unranked early
+    closes.loc[closes.index[:390], "X1"] = np.nan  # never reaches 60 closes
+    closes.loc[closes.index[::17], "X2"] = np.nan  # gaps mid-history
+    tickers = ["X0", "X1", "X2", "X3", "MISSING"]
+    eval_dates = closes.index[39::5]  # includes row 309, where X0 reaches its 60th close
+
+    rs_inputs = backtest._precompute_rs_inputs(closes)
+    rows = backtest._as_of_positions(closes.index, eval_dates.values)
+    table = backtest._rs_score_table(rs_inputs, rows, tickers)
+
+    expected = np.array([[_reference_rs_at_date(closes, t, d) for t in tickers] for d in eval_dates])
+    np.testing.assert_array_equal(table, expected)
+    assert (table[:, 0] > 0).any() and (table[:, 1] == 0).all() and (table[:, 4] == 0).all()
+
+
+def test_compute_canslim_scores_matches_per_row_composite() -> None:
+    rng = np.random.default_rng(3)
+    components = rng.random((200, 7))
+    has_fundamentals = rng.random(200) < 0.5
+
+    totals = backtest._compute_canslim_scores(components, has_fundamentals)
+
+    expected = [
+        _reference_canslim_score(tuple(row), flag) for row, flag in zip(components, has_fundamentals, strict=True)
+    ]
+    np.testing.assert_array_equal(totals, expected)
+
+
+def test_evaluate_technical_at_date_matches_label_slicing() -> None:
+    """Searchsorted as-of rows plus rolling windows reproduce the per-date ``.loc`` slices."""
+    ticker_data = _synthetic_ohlcv(400, 5)
+    ticker_data.iloc[100, ticker_data.columns.get_loc("Close")] *= 3  # peak that ages out of the 52-week window
+    eval_dates = pd.DatetimeIndex(
+        [
+            ticker_data.index[59] - pd.Timedelta(days=1),
+            *ticker_data.index[60::3],
+            *ticker_data.index[350:354],
+            pd.Timestamp.today().normalize(),
+        ]
+    )
+    rolling = backtest._precompute_rolling_technicals(ticker_data)
+    as_of = backtest._as_of_positions(ticker_data.index, eval_dates.values)
+
+    for eval_date, rows in zip(eval_dates, as_of, strict=True):
+        assert rows == len(ticker_data.loc[:eval_date])
+        fast = backtest._evaluate_technical_at_date(ticker_data, int(rows), 1e9, rolling)
+        if rows < 60:
+            assert fast["n_score"] == 0.0 and "close" not in fast
+            continue
+        expected = _reference_technicals(ticker_data, eval_date)
+        s_score, s_metrics = evaluate_s(
+            ticker_data.loc[:eval_date],
+            expected["avg_vol_50"],
+            expected["close"],
+            expected["high_52"],
+            1e9,
+            s_breakout_proximity=0.95,
+        )
+
+        assert fast["close"] == expected["close"]
+        assert fast["high_52"] == expected["high_52"]
+        assert fast["proximity"] == expected["proximity"]
+        assert fast["n_score"] == expected["n_score"]
+        assert fast["avg_vol_50"] == pytest.approx(expected["avg_vol_50"], rel=1e-12)
+        assert fast["s_score"] == s_score
+        assert fast["is_breakout"] == s_metrics["is_breakout"]
+        assert fast["has_volume_surge"] == s_metrics["has_volume_surge"]
@@ -0,0 +1,170 @@
+"""Tests for the CANSLIM orchestrator — all data fetches are mocked."""
+
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import date
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+from config import settings
+from core.canslim import core
+from core.canslim.core import evaluate_canslim
+from core.canslim.m_market_direction import MarketTrend
+
+
+def _price_history(rows: int = 260) -> pd.DataFrame:
+    closes = np.linspace(100.0, 150.0, rows)
+    return pd.DataFrame(
+        {"Open": closes, "High": closes * 1.01, "Low": closes * 0.99, "Close": closes, "Volume": 1e6},
+        index=pd.bdate_range("2024-01-01", periods=rows),
+    )
+
+
+def test_evaluate_canslim_fetches_fundamentals_concurrently(tmp_path: Path) -> None:
+    """The four FMP fetches must be in flight together; a failed one degrades like before."""
+    barrier = threading.Barrier(4, timeout=5)
+
+    def _fetch(value):
+        def _call(symbol: str):
+            barrier.wait()
+            if isinstance(value, Exception):
+                raise value
+            return value
+
+        return _call
+
+    market_trend = MarketTrend(symbol="SPY", score=0.8, is_bullish=True, latest_close=500.0, indicators={})
+    with (
+        patch("core.score_cache._SCORE_CACHE_DIR", str(tmp_path)),
+        patch("core.canslim.core.fetch_company_info", _fetch({"shares_outstanding": 100_000_000})),
+        patch("core.canslim.core.fetch_quarterly_income_statement", _fetch(RuntimeError("quota"))),
+        patch("core.canslim.core.fetch_annual_income_statement", _fetch(pd.DataFrame())),
+        patch("core.canslim.core.fetch_balance_sheet", _fetch(pd.DataFrame())),
+        patch("core.canslim.core.fetch_ohlcv", return_value=_price_history()),
+    ):
+        result = evaluate_canslim(
+            "FAKE", pd.DataFrame({"Ticker": ["FAKE"], "RS_Score": [90.0]}), market_trend=market_trend
+        )
+
+    assert result is not None
+    assert result["metrics"]["income_statement_error"] == "quota"
+    assert result["metrics"]["shares_outstanding"] == 100_000_000
+
+
+def test_evaluate_canslim_measures_high_over_last_52_weeks_only(tmp_path: Path) -> None:
+    """A peak older than 252 sessions must not count toward proximity to the 52-week high."""
+    history = _price_history(400)
+    history.iloc[10, history.columns.get_loc("Close")] = 1_000.0
+
+    market_trend = MarketTrend(symbol="SPY", score=0.8, is_bullish=True, latest_close=500.0, indicators={})
+    with (
+        patch("core.score_cache._SCORE_CACHE_DIR", str(tmp_path)),
+        patch("core.canslim.core.fetch_company_info", return_value={}),
+        patch("core.canslim.core.fetch_quarterly_income_statement", return_value=pd.DataFrame()),
+        patch("core.canslim.core.fetch_annual_income_statement", return_value=pd.DataFrame()),
+        patch("core.canslim.core.fetch_balance_sheet", return_value=pd.DataFrame()),
+        patch("core.canslim.core.fetch_ohlcv", return_value=history),
+    ):
+        result = evaluate_canslim(
+            "FAKE", pd.DataFrame({"Ticker": ["FAKE"], "RS_Score": [90.0]}), market_trend=market_trend, period="2y"
+        )
+
+    assert result is not None
+    assert result["metrics"]["proximity_to_high"] == 1.0
+
+
+def test_evaluate_canslim_keys_default_market_trend_on_last_completed_session(tmp_path: Path) -> None:
+    """The benchmark memo rolls over with the price and score caches, not the calendar day."""
+    market_trend = MarketTrend(symbol="SPY", score=0.8, is_bullish=True, latest_close=500.0, indicators={})
+    with (
+        patch("core.score_cache._SCORE_CACHE_DIR", str(tmp_path)),
+        patch("core.canslim.core.last_completed_session_date", return_value=date(2024, 1, 5)),
+        patch("core.canslim.core._default_market_trend", return_value=market_trend) as mock_trend,
+        patch("core.canslim.core.fetch_company_info", return_value={}),
+        patch("core.canslim.core.fetch_quarterly_income_statement", return_value=pd.DataFrame()),
+        patch("core.canslim.core.fetch_annual_income_statement", return_value=pd.DataFrame()),
+        patch("core.canslim.core.fetch_balance_sheet", return_value=pd.DataFrame()),
+        patch("core.canslim.core.fetch_ohlcv", return_value=_price_history()),
+    ):
+        result = evaluate_canslim("FAKE", pd.DataFrame({"Ticker": ["FAKE"], "RS_Score": [90.0]}))
+
+    assert result is not None
+    mock_trend.assert_called_once_with("2024-01-05")
+
+
+def test_evaluate_canslim_caps_fundamental_fetches_across_symbols(tmp_path: Path) -> None:
+    """Symbols scored in parallel share one fetch pool instead of opening one each."""
+    lock = threading.Lock()
+    in_flight = 0
+    peak = 0
+
+    def _fetch(value):
+        def _call(symbol: str):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.02)
+            with lock:
+                in_flight -= 1
+            return value
+
+        return _call
+
+    symbols = [f"SYM{i}" for i in range(6)]
+    rs_scores = pd.DataFrame({"Ticker": symbols, "RS_Score": [90.0] * len(symbols)})
+    market_trend = MarketTrend(symbol="SPY", score=0.8, is_bullish=True, latest_close=500.0, indicators={})
+    with (
+        patch("core.score_cache._SCORE_CACHE_DIR", str(tmp_path)),
+        patch("core.canslim.core.fetch_company_info", _fetch({})),
+        patch("core.canslim.core.fetch_quarterly_income_statement", _fetch(pd.DataFrame())),
+        patch("core.canslim.core.fetch_annual_income_statement", _fetch(pd.DataFrame())),
+        patch("core.canslim.core.fetch_balance_sheet", _fetch(pd.DataFrame())),
+        patch("core.canslim.core.fetch_ohlcv", return_value=_price_history()),
+        ThreadPoolExecutor(max_workers=len(symbols)) as screener,
+    ):
+        results = list(screener.map(lambda s: evaluate_canslim(s, rs_scores, market_trend=market_trend), symbols))
+
+    assert all(result is not None for result in results)
+    assert peak <= settings.HTTP_MAX_WORKERS
+
+
+def test_evaluate_canslim_cancels_pending_fetches_when_company_info_fails(tmp_path: Path) -> None:
+    """The statements of a symbol that won't be scored must not keep spending FMP quota."""
+
+    class _QueuedExecutor:
+        """Leaves every submitted fetch pending except company info, which fails."""
+
+        def __init__(self) -> None:
+            self.futures: list[Future] = []
+
+        def submit(self, fn, *args) -> Future:
+            future: Future = Future()
+            if not self.futures:
+                future.set_exception(RuntimeError("quota"))
+            self.futures.append(future)
+            return future
+
+    executor = _QueuedExecutor()
+    market_trend = MarketTrend(symbol="SPY", score=0.8, is_bullish=True, latest_close=500.0, indicators={})
+    with (
+        patch("core.score_cache._SCORE_CACHE_DIR", str(tmp_path)),
+        patch("core.canslim.core._get_fundamentals_executor", return_value=executor),
+    ):
+        result = evaluate_canslim(
+            "FAKE", pd.DataFrame({"Ticker": ["FAKE"], "RS_Score": [90.0]}), market_trend=market_trend
+        )
+
+    assert result is None
+    assert len(executor.futures) == 4
+    assert all(future.cancelled() for future in executor.futures[1:])
+
+
+def test_fundamentals_executor_is_created_once_and_reused() -> None:
+    assert core._get_fundamentals_executor() is core._get_fundamentals_executor()
@@ -10,7 +10,8 @@ import pytest
 
 import quality_stocks
 from core import momentum_analysis
-from core.canslim import a_annual_earnings, n_new_products
+from core.canslim import _growth, _labels, a_annual_earnings, c_current_earnings, n_new_products
+from core.data_client import _FMP_INCOME_FIELD_MAP, _fmp_records_to_financial_df
 
 # ─── Index routing ───────────────────────────────────────────────────────────
 
@@ -58,46 +59,134 @@ def test_get_sp500_tickers_imported_from_index_fetcher() -> None:
     )
 
 
-# ─── _safe_growth — a_annual_earnings ────────────────────────────────────────
+# ─── safe_growth — shared C/A/N helper ───────────────────────────────────────
 
 
 def test_safe_growth_rejects_negative_previous_annual() -> None:
     """Transitioning from a loss to a profit must return None, not a misleading % gain."""
-    assert a_annual_earnings._safe_growth(1.0, -1.0) is None
-    assert a_annual_earnings._safe_growth(0.5, -0.1) is None
+    assert _growth.safe_growth(1.0, -1.0) is None
+    assert _growth.safe_growth(0.5, -0.1) is None
 
 
 def test_safe_growth_returns_none_for_zero_previous_annual() -> None:
     """Zero previous earnings must return None to avoid division-by-zero growth."""
-    assert a_annual_earnings._safe_growth(1.0, 0) is None
-    assert a_annual_earnings._safe_growth(1.0, None) is None
+    assert _growth.safe_growth(1.0, 0) is None
+    assert _growth.safe_growth(1.0, None) is None
 
 
 def test_safe_growth_positive_control_annual() -> None:
     """Valid positive-to-positive growth must return the correct decimal rate."""
-    result = a_annual_earnings._safe_growth(1.25, 1.0)
+    result = _growth.safe_growth(1.25, 1.0)
     assert result is not None
     assert abs(result - 0.25) < 1e-9, f"Expected 0.25, got {result}"
 
 
-# ─── _safe_growth — n_new_products ───────────────────────────────────────────
+def test_annual_growths_match_scalar_safe_growth() -> None:
+    """The vectorized growth series must agree with _safe_growth pair by pair (most recent first)."""
+    earnings = [1.0, 1.25, -0.5, 0.75, 0.0, 2.0, float("nan"), 3.0]
+    expected = [_growth.safe_growth(earnings[i], earnings[i - 1]) for i in range(len(earnings) - 1, 0, -1)]
+
+    assert a_annual_earnings._get_annual_growths(earnings) == expected
+    assert expected[:2] == [None, None], "missing years must yield None, not NaN"
+
+
+def test_find_earnings_row_prefers_diluted_eps_then_net_income() -> None:
+    """Diluted EPS wins regardless of row order; Net Income is only the fallback."""
+    both = a_annual_earnings.pd.DataFrame(index=["Net Income", "Basic EPS", "Diluted EPS"])
+    ni_only = a_annual_earnings.pd.DataFrame(index=["Total Revenue", "Net Income Common Stockholders", "Net Income"])
+
+    assert _labels.find_earnings_row(both) == "Diluted EPS"
+    assert _labels.find_earnings_row(ni_only) == "Net Income"
+    assert _labels.find_earnings_row(both.iloc[:2]) == "Basic EPS"
+
+
+def test_c_and_a_resolve_net_income_rows_alike() -> None:
+    """Both evaluators share one label table, so the same statement picks the same row."""
+    df = a_annual_earnings.pd.DataFrame(
+        [[1.0, 2.0], [3.0, 4.0]],
+        index=["Net Income From Continuing Operations", "Net Income Common Stockholders"],
+        columns=["2023-12-31", "2024-12-31"],
+    )
+
+    assert c_current_earnings.find_earnings_row is a_annual_earnings.find_earnings_row
+    assert _labels.find_earnings_row(df) == "Net Income Common Stockholders"
+
+
+def test_earnings_row_falls_back_to_basic_eps_when_newest_filing_lacks_diluted() -> None:
+    """A Diluted EPS row left NaN for the newest period by FMP must not win over Basic EPS."""
+
+    def _records(dates: list[str], eps: list[float]) -> list[dict]:
+        records = [
+            {"date": d, "eps": e, "epsDiluted": e * 0.98, "netIncome": e * 1e6} for d, e in zip(dates, eps, strict=True)
+        ]
+        del records[-1]["epsDiluted"]
+        return records
+
+    quarters = ["2023-03-31", "2023-06-30", "2023-09-30", "2023-12-31", "2024-03-31"]
+    quarterly = _fmp_records_to_financial_df(_records(quarters, [1.0, 1.1, 1.2, 1.3, 1.5]), _FMP_INCOME_FIELD_MAP)
+    years = ["2020-12-31", "2021-12-31", "2022-12-31", "2023-12-31"]
+    annual = _fmp_records_to_financial_df(_records(years, [2.0, 2.5, 3.0, 3.9]), _FMP_INCOME_FIELD_MAP)
+
+    assert _labels.find_earnings_row(quarterly) == "Basic EPS"
+    score_c, current_growth = c_current_earnings.evaluate_c(quarterly)
+    assert current_growth is not None and abs(current_growth - 0.5) < 1e-9
+    assert score_c > 0.0
+
+    assert _labels.find_earnings_row(annual) == "Basic EPS"
+    score_a, annual_growth, _ = a_annual_earnings.evaluate_a(annual)
+    assert annual_growth is not None and abs(annual_growth - 0.3) < 1e-9
+    assert score_a > 0.0
+
+
+def test_evaluate_c_scores_non_numeric_earnings_as_missing() -> None:
+    """A row that can't be read as numbers must score 0 without raising."""
+    pd = c_current_earnings.pd
+    periods = pd.date_range("2023-03-31", periods=5, freq="QE")
+    bad = pd.DataFrame([["n/a", 1.0, 1.1, 1.2, 1.5]], index=["Diluted EPS"], columns=periods)
+    good = pd.DataFrame([[1.0, 1.0, 1.1, 1.2, 1.5]], index=["Diluted EPS"], columns=periods)
+
+    assert c_current_earnings.evaluate_c(bad) == (0.0, None)
+    score, growth = c_current_earnings.evaluate_c(good)
+    assert growth is not None and abs(growth - 0.5) < 1e-9
+    assert 0.0 < score <= 1.0
+
+
+def test_earnings_evaluators_use_first_of_duplicated_eps_rows() -> None:
+    """A repeated row label must resolve to its first row instead of raising on a sub-frame."""
+    pd = c_current_earnings.pd
+    quarters = pd.date_range("2023-03-31", periods=5, freq="QE")
+    years = pd.date_range("2020-12-31", periods=4, freq="YE")
+    quarterly = pd.DataFrame(
+        [[1.0, 1.1, 1.2, 1.3, 1.5], [9.0, 9.0, 9.0, 9.0, 9.0]], index=["Diluted EPS", "Diluted EPS"], columns=quarters
+    )
+    annual = pd.DataFrame(
+        [[2.0, 2.5, 3.0, 3.9], [9.0, 9.0, 9.0, 9.0]], index=["Diluted EPS", "Diluted EPS"], columns=years
+    )
+
+    assert c_current_earnings.evaluate_c(quarterly) == c_current_earnings.evaluate_c(quarterly.iloc[:1])
+    assert c_current_earnings.evaluate_c(quarterly)[1] == pytest.approx(0.5)
+    assert a_annual_earnings.evaluate_a(annual) == a_annual_earnings.evaluate_a(annual.iloc[:1])
+    assert a_annual_earnings.evaluate_a(annual)[1] == pytest.approx(0.3)
+
+
+# ─── safe_growth — as imported by n_new_products ─────────────────────────────
 
 
 def test_safe_growth_rejects_negative_previous_n() -> None:
     """n_new_products must apply the same negative-previous guard as a_annual_earnings."""
-    assert n_new_products._safe_growth(1.0, -1.0) is None
-    assert n_new_products._safe_growth(0.5, -0.1) is None
+    assert n_new_products.safe_growth(1.0, -1.0) is None
+    assert n_new_products.safe_growth(0.5, -0.1) is None
 
 
 def test_safe_growth_returns_none_for_zero_previous_n() -> None:
     """Zero previous in n_new_products must return None."""
-    assert n_new_products._safe_growth(1.0, 0) is None
-    assert n_new_products._safe_growth(1.0, None) is None
+    assert n_new_products.safe_growth(1.0, 0) is None
+    assert n_new_products.safe_growth(1.0, None) is None
 
 
 def test_safe_growth_positive_control_n() -> None:
     """n_new_products positive growth must return the correct decimal rate."""
-    result = n_new_products._safe_growth(1.25, 1.0)
+    result = n_new_products.safe_growth(1.25, 1.0)
     assert result is not None
     assert abs(result - 0.25) < 1e-9, f"Expected 0.25, got {result}"
 
@@ -124,3 +213,37 @@ def test_rs_cache_requires_broad_universe_and_requested_symbols() -> None:
 
     assert momentum_analysis._cache_covers_requested_universe(broad_df, ["AAPL", "MSFT"]) is True
     assert momentum_analysis._cache_covers_requested_universe(tiny_df, ["AAPL", "MSFT"]) is False
+
+
+def test_weighted_performance_table_matches_per_ticker_calculation() -> None:
+    """The whole-frame RS performance must equal calculate_weighted_performance column by column."""
+    pd = momentum_analysis.pd
+    index = pd.bdate_range("2024-01-01", periods=300)
+    closes = pd.DataFrame(
+        {
+            "UP": [100.0 + i for i in range(300)],
+            "DOWN": [400.0 - i for i in range(300)],
+            "GAP": [float("nan")] * 50 + [50.0 + i for i in range(250)],
+        },
+        index=index,
+    )
+
+    table = momentum_analysis._weighted_performance_table(closes)
+
+    for ticker in ["UP", "DOWN"]:
+        assert table[ticker] == momentum_analysis.calculate_weighted_performance(closes[ticker])
+    assert pd.isna(table["GAP"])
+    assert momentum_analysis._weighted_performance_table(closes.tail(100)).isna().all()
+
+
+def test_rs_score_lookup_matches_dataframe_lookup() -> None:
+    """The ticker mapping must give the same scores as the per-symbol DataFrame scan."""
+    rs_df = momentum_analysis.pd.DataFrame({"Ticker": ["AAPL", "MSFT", "AAPL"], "RS_Score": [90.0, 80.0, 10.0]})
+
+    lookup = momentum_analysis.rs_score_lookup(rs_df)
+
+    for symbol in ["AAPL", "MSFT", "NOPE"]:
+        assert momentum_analysis.calculate_rs_momentum(symbol, lookup) == momentum_analysis.calculate_rs_momentum(
+            symbol, rs_df
+        )
+    assert momentum_analysis.rs_score_lookup(momentum_analysis.pd.DataFrame()) == {}
@@ -2,12 +2,23 @@
 
 import os
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pandas as pd
+import pytest
+from alpaca.data.models.bars import BarSet
 
 import enhanced_scanner
-from core.data_client import validate_ticker
+from core.data_client import (
+    clear_session_cache,
+    coerce_scalar,
+    extract_float_series,
+    fetch_bulk_close_prices,
+    fetch_ohlcv,
+    fetch_ohlcv_bulk,
+    validate_ticker,
+)
 
 # ─── export_results_to_csv ────────────────────────────────────────────────────
 
@@ -85,3 +96,108 @@ def test_validate_ticker_returns_false_on_empty_dataframe() -> None:
     with patch("core.data_client.fetch_ohlcv", return_value=pd.DataFrame()):
         result = validate_ticker("EMPTY")
     assert result is False
+
+
+# ─── fetch_ohlcv_bulk ────────────────────────────────────────────────────────
+
+
+def _raw_bar(timestamp: str, close: float) -> dict:
+    return {"t": timestamp, "o": close, "h": close, "l": close, "c": close, "v": 100.0, "n": 1, "vw": close}
+
+
+def test_fetch_ohlcv_bulk_splits_symbols_and_fills_session_cache(tmp_path: Path) -> None:
+    """One multi-symbol request yields per-symbol frames that later fetch_ohlcv calls reuse."""
+    clear_session_cache()
+    raw = {
+        "AAA": [_raw_bar("2024-01-02T05:00:00Z", 1.5), _raw_bar("2024-01-03T05:00:00Z", 1.6)],
+        "BBB": [_raw_bar("2024-01-02T05:00:00Z", 10.0), _raw_bar("2024-01-03T05:00:00Z", 11.0)],
+    }
+    client = MagicMock()
+    client.get_stock_bars.return_value = BarSet(raw)
+
+    with (
+        patch("core.data_client._get_alpaca_client", return_value=client),
+        patch("core.data_client._PRICE_CACHE_DIR", str(tmp_path)),
+    ):
+        frames = fetch_ohlcv_bulk(["AAA", "BBB", "NONE"], period="5d")
+        single = fetch_ohlcv("BBB", period="5d")
+
+    clear_session_cache()
+    assert client.get_stock_bars.call_count == 1
+    assert set(frames) == {"AAA", "BBB"}
+    assert list(frames["AAA"].columns) == ["Open", "High", "Low", "Close", "Volume"]
+    assert frames["BBB"]["Close"].tolist() == [10.0, 11.0]
+    assert frames["BBB"].index.tz is None
+    assert frames["BBB"]["Volume"].dtype == float
+    assert single is frames["BBB"]
+
+
+def test_fetch_ohlcv_bulk_reads_disk_cache_across_sessions(tmp_path: Path) -> None:
+    """A fresh process (empty session cache) reuses bars persisted for the same completed session."""
+    clear_session_cache()
+    client = MagicMock()
+    client.get_stock_bars.return_value = BarSet({"AAA": [_raw_bar("2024-01-02T05:00:00Z", 1.5)]})
+
+    with (
+        patch("core.data_client._get_alpaca_client", return_value=client),
+        patch("core.data_client._PRICE_CACHE_DIR", str(tmp_path)),
+    ):
+        fetch_ohlcv_bulk(["AAA"], period="5d")
+        clear_session_cache()
+        frames = fetch_ohlcv_bulk(["AAA"], period="5d")
+
+    clear_session_cache()
+    assert client.get_stock_bars.call_count == 1
+    assert frames["AAA"]["Close"].tolist() == [1.5]
+
+
+# ─── fetch_bulk_close_prices ─────────────────────────────────────────────────
+
+
+def test_fetch_bulk_close_prices_aligns_chunks_on_union_of_dates(tmp_path: Path) -> None:
+    """Closes from separate chunks land in one tz-naive frame; missing dates become NaN."""
+    clear_session_cache()
+    raw = {
+        "AAA": [_raw_bar("2024-01-02T05:00:00Z", 1.0), _raw_bar("2024-01-03T05:00:00Z", 2.0)],
+        "BBB": [_raw_bar("2024-01-03T05:00:00Z", 20.0)],
+    }
+    client = MagicMock()
+    client.get_stock_bars.side_effect = lambda req: BarSet({s: raw[s] for s in req.symbol_or_symbols if s in raw})
+
+    with (
+        patch("core.data_client._get_alpaca_client", return_value=client),
+        patch("core.data_client._PRICE_CACHE_DIR", str(tmp_path)),
+        patch("core.data_client.time.sleep") as mock_sleep,
+    ):
+        closes = fetch_bulk_close_prices(["AAA", "BBB", "NONE"], period="5d", chunk_size=1)
+
+    clear_session_cache()
+    assert client.get_stock_bars.call_count == 3
+    assert mock_sleep.call_count == 2  # paced after each chunk that returned bars
+    assert sorted(closes.columns) == ["AAA", "BBB"]
+    assert closes.index.tz is None
+    assert closes["AAA"].tolist() == [1.0, 2.0]
+    assert pd.isna(closes["BBB"].iloc[0])
+    assert closes["BBB"].iloc[1] == 20.0
+
+
+def test_extract_float_series_reuses_float_columns_and_converts_others() -> None:
+    df = pd.DataFrame({"Close": [1.5, 2.5], "Volume": [100, 200]})
+
+    closes = extract_float_series(df, "Close")
+    volumes = extract_float_series(df, "Volume")
+
+    assert np.shares_memory(closes.to_numpy(), df["Close"].to_numpy())
+    assert volumes.dtype == np.float64
+    assert volumes.tolist() == [100.0, 200.0]
+
+
+def test_coerce_scalar_unwraps_containers_and_rejects_non_finite_floats() -> None:
+    values = np.array([1.0, 2.0, np.nan])
+
+    assert type(coerce_scalar(values[1])) is float
+    assert coerce_scalar(pd.Series([3.0, 4.0])) == 4.0
+    assert coerce_scalar(np.array([5])) == 5.0
+    for bad in (values[2], float("inf")):
+        with pytest.raises(ValueError):
+            coerce_scalar(bad)
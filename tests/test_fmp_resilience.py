@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import time
+from datetime import datetime
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -11,9 +12,14 @@ import requests
 
 from core.data_client import (
     _fund_cache_get,
+    _fetch_fmp_raw_history,
     _fund_cache_set,
     _fmp_get,
+    clear_session_cache,
+    fetch_company_info,
+    fetch_fundamental_data_as_of,
     fetch_quarterly_income_statement,
+    prefetch_fundamental_histories,
 )
 from core.canslim.c_current_earnings import evaluate_c
 
@@ -147,6 +153,86 @@ def test_fetch_quarterly_uses_disk_cache_on_second_call(tmp_path: Path) -> None:
         pd.testing.assert_frame_equal(df1, df2)
 
 
+def test_prefetch_fundamental_histories_serves_as_of_lookups_from_cache(tmp_path: Path) -> None:
+    """After a prefetch, point-in-time lookups for any date must not hit FMP again."""
+    record = {"date": "2024-03-31", "acceptedDate": "2024-04-25 16:05:00", "epsDiluted": 1.0, "revenue": 10.0}
+    clear_session_cache()
+    with (
+        patch("core.data_client._FUND_CACHE_DIR", str(tmp_path)),
+        patch("core.data_client._fmp_get", return_value=[record]) as mock_api,
+    ):
+        prefetch_fundamental_histories(["AAA", "BBB"])
+        calls_after_prefetch = mock_api.call_count
+        before = fetch_fundamental_data_as_of("AAA", datetime(2024, 4, 1))
+        after = fetch_fundamental_data_as_of("BBB", datetime(2024, 6, 1))
+
+    clear_session_cache()
+    assert calls_after_prefetch == 8  # 4 endpoints x 2 symbols
+    assert mock_api.call_count == calls_after_prefetch
+    assert before["quarterly_income"].empty
+    assert not after["quarterly_income"].empty
+
+
+def test_raw_history_with_failed_endpoint_is_not_persisted(tmp_path: Path) -> None:
+    """A bundle where one endpoint came back empty must be re-fetched next run, not served from disk."""
+    record = {"date": "2024-03-31", "epsDiluted": 1.0}
+
+    def _balance_sheet_down(endpoint: str, params: dict | None = None) -> list:
+        return [] if endpoint == "balance-sheet-statement" else [record]
+
+    clear_session_cache()
+    with (
+        patch("core.data_client._FUND_CACHE_DIR", str(tmp_path)),
+        patch("core.data_client._fmp_get", side_effect=_balance_sheet_down),
+    ):
+        _fetch_fmp_raw_history("AAA")
+    clear_session_cache()
+    with (
+        patch("core.data_client._FUND_CACHE_DIR", str(tmp_path)),
+        patch("core.data_client._fmp_get", return_value=[record]) as mock_api,
+    ):
+        recovered = _fetch_fmp_raw_history("AAA")
+        clear_session_cache()
+        _fetch_fmp_raw_history("AAA")
+
+    clear_session_cache()
+    assert recovered["bs_raw"] == [record]
+    assert mock_api.call_count == 4  # second run re-fetched; third run read the complete bundle from disk
+
+
+def test_fetch_company_info_skips_unavailable_institutional_endpoint(tmp_path: Path) -> None:
+    """With the free-tier default, only the profile endpoint is requested."""
+    clear_session_cache()
+    profile = [{"marketCap": 1_000_000.0, "price": 10.0}]
+    with (
+        patch("core.data_client._FUND_CACHE_DIR", str(tmp_path)),
+        patch("core.data_client._fmp_get", return_value=profile) as mock_get,
+    ):
+        info = fetch_company_info("FAKE")
+
+    clear_session_cache()
+    assert [c.args[0] for c in mock_get.call_args_list] == ["profile"]
+    assert info["shares_outstanding"] == 100_000
+    assert info["institution_count"] is None
+
+
+def test_fetch_company_info_reuses_disk_cache_across_sessions(tmp_path: Path) -> None:
+    """A second run must read shares outstanding from disk instead of re-requesting the profile."""
+    clear_session_cache()
+    profile = [{"marketCap": 1_000_000.0, "price": 10.0}]
+    with (
+        patch("core.data_client._FUND_CACHE_DIR", str(tmp_path)),
+        patch("core.data_client._fmp_get", return_value=profile) as mock_get,
+    ):
+        first = fetch_company_info("FAKE")
+        clear_session_cache()
+        second = fetch_company_info("FAKE")
+
+    clear_session_cache()
+    assert mock_get.call_count == 1
+    assert second == first
+
+
 # ─── C score 4-quarter YoY fallback ─────────────────────────────────────────
 
 
@@ -1,8 +1,20 @@
 """Unit tests for M (Market Direction) component."""
 
+import dataclasses
+import pickle
+from unittest.mock import patch
+
+import numpy as np
 import pandas as pd
+import pytest
 
-from core.canslim.m_market_direction import _count_distribution_days, _detect_follow_through_day
+from core.canslim import core
+from core.canslim.m_market_direction import (
+    MarketTrend,
+    _count_distribution_days,
+    _detect_follow_through_day,
+    score_market_trend,
+)
 
 
 def test_count_distribution_days():
@@ -19,3 +31,51 @@ def test_detect_follow_through_day():
     # Down day then 4 up days, last day >1.5% and high volume
     ftd = _detect_follow_through_day(closes, volumes, min_rally_pct=0.015, min_rally_day=4)
     assert ftd is True
+
+
+def test_detect_follow_through_day_resets_on_meaningful_decline():
+    closes = pd.Series([100, 101, 102, 100, 101, 103])
+    volumes = pd.Series([1000, 1100, 1200, 1300, 1400, 1500])
+    # Two up days, a -2% reset, then only day 2 of the new rally
+    assert _detect_follow_through_day(closes.to_numpy(), volumes.to_numpy(), min_rally_day=4) is False
+    assert _count_distribution_days(closes.to_numpy(), volumes.to_numpy(), lookback=5) == 1
+
+
+def test_default_market_trend_is_computed_once_per_day():
+    trend = MarketTrend(symbol="SPY", score=0.8, is_bullish=True, latest_close=500.0, indicators={})
+    core._default_market_trend.cache_clear()
+    with patch("core.canslim.core.evaluate_m", return_value=trend) as mock_m:
+        assert core._default_market_trend("2024-01-02") is trend
+        assert core._default_market_trend("2024-01-02") is trend
+        core._default_market_trend("2024-01-03")
+    core._default_market_trend.cache_clear()
+    assert mock_m.call_count == 2
+
+
+def test_score_market_trend_computes_omitted_emas_like_pandas_ewm():
+    rng = np.random.default_rng(0)
+    closes = pd.Series(100 * np.exp(np.cumsum(rng.normal(0.001, 0.01, 260))))
+    closes.iloc[10] = np.nan
+    volumes = pd.Series(rng.integers(1_000, 2_000, 260).astype(float))
+
+    computed = score_market_trend(closes, volumes)
+    explicit = score_market_trend(
+        closes,
+        volumes,
+        ema_21=closes.ewm(span=21).mean(),
+        ema_50=closes.ewm(span=50).mean(),
+        ema_200=closes.ewm(span=200).mean(),
+    )
+
+    assert computed.score == explicit.score
+    for key, value in explicit.indicators.items():
+        assert computed.indicators[key] == pytest.approx(value, rel=1e-12)
+
+
+def test_market_trend_is_immutable_and_pickles() -> None:
+    trend = MarketTrend(symbol="SPY", score=0.8, is_bullish=True, latest_close=500.0, indicators={"ema_21": 1.0})
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        trend.score = 0.1
+    assert not hasattr(trend, "__dict__")
+    assert pickle.loads(pickle.dumps(trend)) == trend
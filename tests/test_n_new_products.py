@@ -27,3 +27,34 @@ def test_evaluate_n_uses_both_signals_when_revenue_exists():
 
     assert revenue_growth is not None
     assert 0.0 < score <= 1.0
+
+
+def test_evaluate_n_prefers_total_revenue_over_other_revenue_rows():
+    dates = [pd.Timestamp(d) for d in ("2024-03-31", "2024-06-30", "2024-09-30", "2025-03-31")]
+    quarterly_income = pd.DataFrame(
+        [[50, 50, 50, 50], [100, 110, 115, 130]],
+        index=["Cost Of Revenue", "Total Revenue"],
+        columns=dates,
+    )
+
+    _, revenue_growth = evaluate_n(quarterly_income, proximity_to_high=0.98)
+
+    assert revenue_growth == 0.3
+
+
+def test_evaluate_n_orders_unsorted_periods_before_computing_growth():
+    dates = [pd.Timestamp(d) for d in ("2025-03-31", "2024-03-31", "2024-09-30", "2024-06-30")]
+    quarterly_income = pd.DataFrame([[130, 100, 115, 110]], index=["Total Revenue"], columns=dates)
+
+    _, revenue_growth = evaluate_n(quarterly_income, proximity_to_high=0.98)
+
+    assert revenue_growth == 0.3
+
+
+def test_evaluate_n_reverses_newest_first_periods():
+    dates = [pd.Timestamp(d) for d in ("2025-03-31", "2024-09-30", "2024-06-30", "2024-03-31")]
+    quarterly_income = pd.DataFrame([[130, 115, 110, 100]], index=["Total Revenue"], columns=dates)
+
+    _, revenue_growth = evaluate_n(quarterly_income, proximity_to_high=0.98)
+
+    assert revenue_growth == 0.3
@@ -0,0 +1,54 @@
+"""Tests for the per-session CANSLIM score disk cache."""
+
+from __future__ import annotations
+
+import re
+from datetime import date
+from pathlib import Path
+from unittest.mock import patch
+
+from core.score_cache import _scoring_settings, load_score, save_score
+
+_CANSLIM_DIR = Path(__file__).resolve().parent.parent / "core" / "canslim"
+
+
+def test_score_cache_round_trip_within_session(tmp_path: Path) -> None:
+    """A saved evaluation is returned only for the same inputs."""
+    result = {"symbol": "FAKE", "total_score": 72.5}
+    with patch("core.score_cache._SCORE_CACHE_DIR", str(tmp_path)):
+        assert load_score("FAKE", (80.0, "1y")) is None
+        save_score("FAKE", (80.0, "1y"), result)
+        assert load_score("FAKE", (80.0, "1y")) == result
+        assert load_score("FAKE", (81.0, "1y")) is None
+
+
+def test_score_cache_rolls_over_with_the_session(tmp_path: Path) -> None:
+    """Entries from a previous completed session are not reused once a new one closes."""
+    with patch("core.score_cache._SCORE_CACHE_DIR", str(tmp_path)):
+        with patch("core.score_cache.last_completed_session_date", return_value=date(2024, 1, 2)):
+            save_score("FAKE", (80.0,), {"total_score": 72.5})
+        with patch("core.score_cache.last_completed_session_date", return_value=date(2024, 1, 3)):
+            assert load_score("FAKE", (80.0,)) is None
+
+
+def test_score_cache_misses_when_scoring_settings_change(tmp_path: Path) -> None:
+    """A config edit mid-session must not keep serving scores computed under the old weights."""
+    fingerprint = _scoring_settings()
+    with patch("core.score_cache._SCORE_CACHE_DIR", str(tmp_path)):
+        save_score("FAKE", (80.0,), {"total_score": 72.5})
+        edited = tuple((name, 0.3 if name == "CANSLIM_WEIGHT_C" else value) for name, value in fingerprint)
+        with patch("core.score_cache._scoring_settings", return_value=edited):
+            assert load_score("FAKE", (80.0,)) is None
+        assert load_score("FAKE", (80.0,)) == {"total_score": 72.5}
+
+
+def test_scoring_settings_cover_every_setting_the_scorers_read() -> None:
+    # The benchmark period only feeds the market trend, which is already a key input;
+    # the worker count only affects how fundamentals are fetched
+    not_scoring = {"MARKET_TREND_PERIOD", "HTTP_MAX_WORKERS"}
+    read = {
+        name
+        for path in _CANSLIM_DIR.glob("*.py")
+        for name in re.findall(r"settings\.([A-Z][A-Z0-9_]*)", path.read_text())
+    }
+    assert read - not_scoring <= {name for name, _ in _scoring_settings()}
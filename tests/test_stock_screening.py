@@ -1,7 +1,17 @@
 """Tests for scanner classification between actionable buys and watchlist names."""
 
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from config import settings
 from core.canslim.m_market_direction import MarketTrend
-from core.stock_screening import _classify_canslim_candidate
+from core.stock_screening import (
+    _classify_canslim_candidate,
+    _prefetch_price_history,
+    screen_stocks_canslim_detailed,
+)
 
 
 def _make_view(
@@ -69,3 +79,37 @@ def test_classifier_rejects_name_below_watchlist_floor() -> None:
 
     assert category == "rejected"
     assert notes == ["below_watchlist_score"]
+
+
+def test_prefetch_price_history_requests_one_bulk_call_per_chunk() -> None:
+    symbols = [f"S{i}" for i in range(settings.CHUNK_SIZE + 1)]
+    failure = requests.ConnectionError("boom")
+    with patch("core.stock_screening.fetch_ohlcv_bulk", side_effect=[failure, {}]) as mock_bulk:
+        _prefetch_price_history(symbols)
+
+    assert [len(c.args[0]) for c in mock_bulk.call_args_list] == [settings.CHUNK_SIZE, 1]
+    assert mock_bulk.call_args.kwargs["period"] == settings.CANSLIM_DATA_PERIOD
+
+
+def test_prefetch_price_history_does_not_swallow_programming_errors() -> None:
+    with (
+        patch("core.stock_screening.fetch_ohlcv_bulk", side_effect=KeyError("close")),
+        pytest.raises(KeyError),
+    ):
+        _prefetch_price_history(["AAA"])
+
+
+def test_screen_skips_per_symbol_work_in_bearish_market_when_enabled() -> None:
+    bearish = _make_view(is_bullish=False)["market_trend"]
+    with (
+        patch("core.stock_screening.evaluate_market_direction", return_value=bearish),
+        patch("core.stock_screening.calculate_rs_scores_for_tickers") as mock_rs,
+        patch("core.stock_screening.evaluate_canslim") as mock_eval,
+    ):
+        buys, watchlist, market_trend = screen_stocks_canslim_detailed(
+            ["AAA", "BBB"], start_date="2025-01-01", skip_when_bearish=True
+        )
+
+    assert (buys, watchlist, market_trend) == ([], [], bearish)
+    mock_rs.assert_not_called()
+    mock_eval.assert_not_called()